@@ -5,11 +5,103 @@ Bluetooth Device Connector - SpectrumSnek 🐍📻
 Curses-based interface for scanning and connecting to Bluetooth devices.
 """
 
+import asyncio
 import curses
-import subprocess
+import json
+import os
 import time
 import re
-from typing import List, Dict, Any, Optional
+import shutil
+import sys
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet, Set
+
+try:
+    from dbus_fast import BusType, Message, MessageType, Variant
+    from dbus_fast.aio import MessageBus
+except ImportError:
+    # Without dbus-fast all queries go through bluetoothctl
+    MessageBus = None
+
+# Simulated device offered when scanning fails, for testing without hardware
+DEMO_MAC = "CC:C5:0A:27:5C:45"
+
+# Seconds to keep discovery running before listing devices
+SCAN_SECONDS = 10
+
+# Seconds between idle redraws while waiting for a key
+REDRAW_INTERVAL = 0.1
+
+# Appended to the status line while pairing/connecting
+SPINNER = "|/-\\"
+
+# Devices remembered between runs so re-entering the tool can skip the scan
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "spectrumsnek", "bt_devices.json")
+CACHE_TTL = 24 * 60 * 60
+
+# Device list published by the background scan daemon (bluetooth_tool.scand)
+SNAPSHOT_FILE = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}"), "spectrumsnek-bt.json"
+)
+SNAPSHOT_MAX_AGE = 30
+
+# First BlueZ release whose bluetoothctl accepts "scan bredr"
+BREDR_SCAN_VERSION = (5, 65)
+
+# bluetoothctl prompt, e.g. "[bluetooth]# " or "[Speaker]# "
+_PROMPT_RE = re.compile(rb"\[[^\]]*\][#>]\s*$")
+
+# Any prompt within output, used to split replies to batched commands
+_PROMPT_ANY_RE = re.compile(rb"\[[^\]\n]*\][#>] ?")
+
+# Colour codes, readline markers and carriage returns in interactive output
+_ANSI_RE = re.compile(rb"\x1b\[[0-9;]*[A-Za-z]|[\x01\x02\r]")
+
+# "Device XX:XX:XX:XX:XX:XX Name" lines from the devices command
+_DEV_RE = re.compile(rb'^Device ((?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2})(?:[ \t]+(.*?))?[ \t]*$', re.MULTILINE)
+
+# "Paired: yes" / "Connected: no" lines from the info command
+_STATE_RE = re.compile(rb'^\s*(Paired|Connected):\s*(yes|no)', re.MULTILINE)
+
+# "Controller XX:XX:XX:XX:XX:XX Name [default]" from the list command
+_CONTROLLER_RE = re.compile(rb'^Controller\s+([0-9A-F:]{17})', re.MULTILINE)
+
+# Final line bluetoothctl prints for a pair or connect attempt
+_PAIR_RESULT_RE = re.compile(rb"Pairing successful|(?:Failed to pair|not available)[^\n]*\n")
+_CONNECT_RESULT_RE = re.compile(rb"Connection successful|(?:Failed to connect|not available)[^\n]*\n")
+
+# "Version 5.66" from the version command
+_VERSION_RE = re.compile(rb'Version\s+(\d+)\.(\d+)')
+
+def _bluetoothctl_path() -> str:
+    """Resolve bluetoothctl to an absolute path.
+
+    subprocess only takes its posix_spawn fast path (no page-table copy of
+    the parent) for absolute executables with close_fds=False. Our own fds
+    are non-inheritable by default, so not closing them in the child is safe.
+    """
+    return shutil.which("bluetoothctl") or "bluetoothctl"
+
+def _parse_device_lines(output: bytes) -> List[Tuple[str, str]]:
+    """Parse "Device XX:XX:XX:XX:XX:XX Name" lines into (mac, name) pairs."""
+    devices = []
+    for mac, name in _DEV_RE.findall(output):
+        mac = mac.decode()
+        devices.append((mac, name.decode(errors="replace") if name else f"[{mac}]"))
+    return devices
+
+def _first_adapter(objects: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Return (path, properties) of the first adapter in a BlueZ object tree."""
+    for path, interfaces in sorted(objects.items()):
+        if "org.bluez.Adapter1" in interfaces:
+            return path, interfaces["org.bluez.Adapter1"]
+    return None
+
+# Signals that keep the D-Bus device cache in step with BlueZ
+_BLUEZ_MATCH_RULES = (
+    "type='signal',sender='org.bluez',interface='org.freedesktop.DBus.Properties',"
+    "member='PropertiesChanged',arg0='org.bluez.Device1'",
+    "type='signal',sender='org.bluez',interface='org.freedesktop.DBus.ObjectManager'",
+)
 
 class BluetoothDevice:
     """Represents a Bluetooth device."""
@@ -19,155 +111,575 @@ class BluetoothDevice:
         self.paired = paired
         self.connected = connected
 
+def _apply_device_props(device: BluetoothDevice, props: Dict[str, Any]):
+    """Copy org.bluez.Device1 properties (D-Bus variants) onto a device."""
+    if "Alias" in props:
+        device.name = props["Alias"].value or f"[{device.mac}]"
+    if "Paired" in props:
+        device.paired = props["Paired"].value
+    if "Connected" in props:
+        device.connected = props["Connected"].value
+
 class BluetoothConnector:
     """Bluetooth device connector with curses interface."""
 
+    _TITLE = "Bluetooth Device Connector 🐍📻"
+    _INSTRUCTIONS = "↑↓ navigate, Enter connect, 'r' rescan, 'b' back, 'q' quit"
+    _ICON_PAIRED = "🔗"
+    _ICON_UNPAIRED = "📱"
+
     def __init__(self):
         self.devices: List[BluetoothDevice] = []
         self.selected_index = 0
         self.status_message = ""
+        self._scan_task: Optional[asyncio.Task] = None
+        self._connect_task: Optional[asyncio.Task] = None
+        self._key_ready: Optional[asyncio.Event] = None
+        self._btctl: Optional[asyncio.subprocess.Process] = None
+        self._btctl_lock: Optional[asyncio.Lock] = None
+        # System bus connection; False once connecting has failed
+        self._bus = None
+        # BlueZ object path -> device, kept current by D-Bus signals
+        self._device_cache: Dict[str, BluetoothDevice] = {}
+        self._device_cache_ready = False
+        # MACs changed by signals since the rows were last formatted
+        self._dirty: Set[str] = set()
+        self._scan_mode: Optional[str] = None
+        self._adapter: Optional[str] = None
+        self._adapter_ok = False
+        # (selected row, normal row, MAC row) per device, rebuilt when devices change
+        self._device_lines: Optional[List[Tuple[str, str, str]]] = None
+        # What the screen currently shows; repaint only when it differs
+        self._drawn_state: Optional[tuple] = None
+        # Pad holding the title and instructions, rebuilt when the terminal resizes
+        self._chrome = None
+        self._chrome_size: Optional[Tuple[int, int]] = None
+
+    async def _session(self) -> asyncio.subprocess.Process:
+        """Return the long-lived bluetoothctl session, starting it if needed."""
+        if self._btctl is None or self._btctl.returncode is not None:
+            self._btctl = await asyncio.create_subprocess_exec(
+                _bluetoothctl_path(),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                close_fds=False
+            )
+            # Swallow the startup banner up to the first prompt
+            await self._read_until(_PROMPT_RE, timeout=5)
+        return self._btctl
+
+    async def _read_until(self, pattern: "re.Pattern[bytes]", timeout: float, count: int = 1) -> bytes:
+        """Read raw session output until pattern matches count times, raising on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        raw = b""
+        output = b""
+        while len(pattern.findall(output)) < count:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            chunk = await asyncio.wait_for(self._btctl.stdout.read(4096), remaining)
+            if not chunk:
+                raise RuntimeError("bluetoothctl session ended")
+            # Strip the whole buffer so escape codes split across reads still go
+            raw += chunk
+            output = _ANSI_RE.sub(b"", raw)
+        return output
+
+    async def _drain(self):
+        """Discard unsolicited session output such as scan events."""
+        # Bounded, since an active scan can keep emitting events indefinitely
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 0.5
+        while loop.time() < deadline:
+            try:
+                chunk = await asyncio.wait_for(self._btctl.stdout.read(4096), 0.01)
+            except asyncio.TimeoutError:
+                return
+            if not chunk:
+                return
+
+    async def _send(self, lines: List[str], until: "re.Pattern[bytes]", count: int, timeout: float) -> bytes:
+        """Write commands in a single write and read until `until` matched `count` times."""
+        if self._btctl_lock is None:
+            self._btctl_lock = asyncio.Lock()
+        async with self._btctl_lock:
+            proc = await self._session()
+            await self._drain()
+            proc.stdin.write("".join(f"{line}\n" for line in lines).encode())
+            await proc.stdin.drain()
+            try:
+                return await self._read_until(until, timeout, count)
+            except (asyncio.TimeoutError, asyncio.CancelledError, RuntimeError):
+                # Output is out of step with our commands; start afresh next time
+                proc.kill()
+                self._btctl = None
+                raise
+
+    async def _cmd(self, line: str, until: Optional["re.Pattern[bytes]"] = None, timeout: float = 5) -> bytes:
+        """Send one command to the bluetoothctl session and return its output."""
+        return await self._send([line], until or _PROMPT_RE, 1, timeout)
+
+    async def _cmds(self, lines: List[str], timeout: float = 5) -> List[bytes]:
+        """Send several commands at once and return each one's output."""
+        output = await self._send(lines, _PROMPT_ANY_RE, len(lines), timeout)
+        return _PROMPT_ANY_RE.split(output)[:len(lines)]
+
+    async def close(self):
+        """Shut down the bluetoothctl session and D-Bus connection."""
+        if self._bus:
+            self._bus.disconnect()
+        self._bus = None
+        self._device_cache_ready = False
+
+        proc, self._btctl = self._btctl, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.write(b"quit\n")
+            await proc.stdin.drain()
+            await asyncio.wait_for(proc.wait(), 2)
+        except (asyncio.TimeoutError, ConnectionError):
+            proc.kill()
+            await proc.wait()
+
+    async def _get_scan_mode(self) -> str:
+        """Return the scan argument to use, preferring BR/EDR-only discovery."""
+        if self._scan_mode is None:
+            output = await self._cmd("version")
+            match = _VERSION_RE.search(output)
+            version = (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+            # Classic audio/HID targets don't need LE advertisements
+            self._scan_mode = "bredr" if version >= BREDR_SCAN_VERSION else "on"
+        return self._scan_mode
+
+    async def _paired_macs(self, output: Optional[bytes] = None) -> FrozenSet[str]:
+        """Return the MACs of all paired devices with a single bluetoothctl call.
+
+        Pass the output of an already sent paired-devices command to skip
+        the round trip.
+        """
+        if output is None:
+            output = await self._cmd("paired-devices")
+        if b"Invalid command" in output:
+            # Newer BlueZ replaced paired-devices with a filter on devices
+            output = await self._cmd("devices Paired")
+        return frozenset(mac for mac, _ in _parse_device_lines(output))
+
+    async def _system_bus(self):
+        """Return the cached system bus connection, or None if unavailable."""
+        if self._bus is None and MessageBus is not None:
+            try:
+                self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+                await self._watch_devices(self._bus)
+            except Exception:
+                self._bus = False  # Don't retry on every scan
+        return self._bus or None
+
+    async def _watch_devices(self, bus):
+        """Subscribe to BlueZ device signals so the device cache stays current."""
+        bus.add_message_handler(self._on_bluez_signal)
+        for rule in _BLUEZ_MATCH_RULES:
+            await bus.call(Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="AddMatch",
+                signature="s",
+                body=[rule]
+            ))
+
+    def _on_bluez_signal(self, message):
+        """Apply a BlueZ device signal to the cache and mark the device dirty."""
+        if message.message_type != MessageType.SIGNAL:
+            return
+
+        if message.member == "PropertiesChanged" and message.body[0] == "org.bluez.Device1":
+            device = self._device_cache.get(message.path)
+            if device is not None:
+                _apply_device_props(device, message.body[1])
+                self._dirty.add(device.mac)
+        elif message.member == "InterfacesAdded":
+            path, interfaces = message.body
+            props = interfaces.get("org.bluez.Device1")
+            if props and "Address" in props:
+                device = BluetoothDevice(props["Address"].value, "")
+                _apply_device_props(device, props)
+                self._device_cache[path] = device
+                self._dirty.add(device.mac)
+        elif message.member == "InterfacesRemoved":
+            path, interfaces = message.body
+            if "org.bluez.Device1" in interfaces:
+                device = self._device_cache.pop(path, None)
+                if device is not None:
+                    self._dirty.add(device.mac)
+
+    async def _managed_objects(self) -> Optional[Dict[str, Any]]:
+        """Return BlueZ's object tree, or None when D-Bus is unavailable."""
+        bus = await self._system_bus()
+        if bus is None:
+            return None
+
+        reply = await bus.call(Message(
+            destination="org.bluez",
+            path="/",
+            interface="org.freedesktop.DBus.ObjectManager",
+            member="GetManagedObjects"
+        ))
+        if reply.message_type == MessageType.ERROR:
+            return None
+        return reply.body[0]
+
+    async def _adapter_call(self, path: str, member: str, signature: str = "", body: Optional[list] = None):
+        """Call an org.bluez.Adapter1 method, raising on a D-Bus error."""
+        reply = await self._bus.call(Message(
+            destination="org.bluez",
+            path=path,
+            interface="org.bluez.Adapter1",
+            member=member,
+            signature=signature,
+            body=body or []
+        ))
+        if reply.message_type == MessageType.ERROR:
+            raise RuntimeError(f"{member} failed: {reply.error_name}")
+
+    async def _dbus_discover(self) -> Optional[bool]:
+        """Run one BR/EDR discovery window over D-Bus.
+
+        Returns None when D-Bus is unavailable, False if the adapter is
+        powered off and True once the window has elapsed.
+        """
+        objects = await self._managed_objects()
+        if objects is None:
+            return None
+
+        adapter = _first_adapter(objects)
+        if adapter is None:
+            return None
+        path, props = adapter
+        if "Powered" in props and not props["Powered"].value:
+            return False
 
-    def scan_devices(self) -> List[BluetoothDevice]:
+        # Classic audio/HID targets don't need LE advertisements
+        await self._adapter_call(path, "SetDiscoveryFilter", "a{sv}", [{"Transport": Variant("s", "bredr")}])
+        await self._adapter_call(path, "StartDiscovery")
+        try:
+            await asyncio.sleep(SCAN_SECONDS)
+        finally:
+            try:
+                await self._adapter_call(path, "StopDiscovery")
+            except Exception:
+                pass  # Discovery also ends when our bus connection closes
+        return True
+
+    async def _bluez_devices(self) -> Optional[List[BluetoothDevice]]:
+        """Return all known devices from the signal-fed cache.
+
+        The cache is filled by one GetManagedObjects call and then kept
+        current by BlueZ signals, so later calls cost no D-Bus traffic.
+        Returns None when D-Bus is unavailable so callers can fall back to
+        bluetoothctl.
+        """
+        if not self._device_cache_ready:
+            objects = await self._managed_objects()
+            if objects is None:
+                return None
+
+            self._device_cache.clear()
+            for path, interfaces in objects.items():
+                props = interfaces.get("org.bluez.Device1")
+                if not props or "Address" not in props or not path.startswith("/org/bluez/hci"):
+                    continue
+                device = BluetoothDevice(props["Address"].value, "")
+                _apply_device_props(device, props)
+                self._device_cache[path] = device
+            self._device_cache_ready = True
+
+        self._dirty.clear()
+        return list(self._device_cache.values())
+
+    async def _refresh_state(self, devices: List[BluetoothDevice], paired_output: Optional[bytes] = None):
+        """Update paired/connected flags on already known devices."""
+        try:
+            current = await self._bluez_devices()
+        except Exception:
+            current = None
+        if current is not None:
+            by_mac = {device.mac: device for device in current}
+            for device in devices:
+                known = by_mac.get(device.mac)
+                device.paired = known.paired if known else False
+                device.connected = known.connected if known else False
+            return
+
+        paired_macs = await self._paired_macs(paired_output)
+        for device in devices:
+            device.paired = device.mac in paired_macs
+            device.connected = False
+
+        # Only paired devices can be connected; query them all in one batch
+        paired = [device for device in devices if device.paired]
+        if paired:
+            replies = await self._cmds([f"info {device.mac}" for device in paired])
+            for device, reply in zip(paired, replies):
+                state = dict(_STATE_RE.findall(reply))
+                device.connected = state.get(b"Connected") == b"yes"
+
+    async def _adapter_address(self) -> str:
+        """Return the default controller's address, used to key the cache."""
+        if self._adapter is None:
+            try:
+                adapter = _first_adapter(await self._managed_objects() or {})
+            except Exception:
+                adapter = None
+            if adapter is not None and "Address" in adapter[1]:
+                self._adapter = adapter[1]["Address"].value
+            else:
+                match = _CONTROLLER_RE.search(await self._cmd("list"))
+                self._adapter = match.group(1).decode() if match else ""
+        return self._adapter
+
+    def _load_cache(self, adapter: str) -> List[BluetoothDevice]:
+        """Load devices remembered for this adapter, if still fresh."""
+        try:
+            if time.time() - os.path.getmtime(CACHE_FILE) > CACHE_TTL:
+                return []
+            with open(CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return []
+
+        if cache.get("adapter") != adapter:
+            return []
+        return [BluetoothDevice(entry["mac"], entry["name"]) for entry in cache.get("devices", [])]
+
+    def _save_cache(self, adapter: str, devices: List[BluetoothDevice]):
+        """Remember scanned devices for the next run."""
+        try:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            with open(CACHE_FILE, 'w') as f:
+                json.dump({
+                    "adapter": adapter,
+                    "devices": [{"mac": d.mac, "name": d.name} for d in devices]
+                }, f)
+        except OSError:
+            pass
+
+    def _load_snapshot(self) -> List[BluetoothDevice]:
+        """Return devices from a recent scan daemon snapshot, if any."""
+        try:
+            if time.time() - os.path.getmtime(SNAPSHOT_FILE) > SNAPSHOT_MAX_AGE:
+                return []
+            with open(SNAPSHOT_FILE, 'r') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return []
+
+        return [
+            BluetoothDevice(d["mac"], d["name"], d.get("paired", False), d.get("connected", False))
+            for d in snapshot.get("devices", [])
+        ]
+
+    async def scan_devices(self) -> List[BluetoothDevice]:
         """Scan for available Bluetooth devices using bluetoothctl."""
-        devices = []
+        # The scan daemon already has a fresh list; no need to scan here
+        devices = self._load_snapshot()
+        if devices:
+            self.status_message = f"Found {len(devices)} device(s) (background scan)"
+            return devices
 
         try:
-            # Start scanning
             self.status_message = "Scanning for devices..."
-            scan_process = subprocess.run(
-                ["bluetoothctl", "scan", "on"],
-                capture_output=True, text=True, timeout=10
-            )
-
-            # Get list of devices
-            list_process = subprocess.run(
-                ["bluetoothctl", "devices"],
-                capture_output=True, text=True, timeout=5
-            )
+            try:
+                discovered = await self._dbus_discover()
+            except Exception:
+                discovered = None
+
+            if discovered is False:
+                self.status_message = "Bluetooth adapter is powered off"
+                return devices
+
+            if discovered is None:
+                # Adapter power rarely changes within a session, so check it once
+                if not self._adapter_ok:
+                    if b"Powered: yes" not in await self._cmd("show"):
+                        self.status_message = "Bluetooth adapter is powered off"
+                        return devices
+                    self._adapter_ok = True
+
+                # Discover for a fixed window within the shared session
+                await self._cmd(f"scan {await self._get_scan_mode()}")
+                await asyncio.sleep(SCAN_SECONDS)
+                await self._cmd("scan off")
+
+            # Get list of devices, straight from BlueZ when D-Bus is available
+            try:
+                bluez_devices = await self._bluez_devices()
+            except Exception:
+                bluez_devices = None
 
-            if list_process.returncode == 0:
-                lines = list_process.stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        # Parse bluetoothctl device output: "Device XX:XX:XX:XX:XX:XX Device Name"
-                        parts = line.split(maxsplit=2)
-                        if len(parts) >= 2:
-                            mac = parts[1]
-                            name = parts[2] if len(parts) > 2 else f"[{mac}]"
-
-                            # Check if device is paired or connected
-                            info_process = subprocess.run(
-                                ["bluetoothctl", "info", mac],
-                                capture_output=True, text=True, timeout=5
-                            )
-
-                            paired = False
-                            connected = False
-                            if info_process.returncode == 0:
-                                info_output = info_process.stdout
-                                paired = "Paired: yes" in info_output
-                                connected = "Connected: yes" in info_output
-
-                            devices.append(BluetoothDevice(mac, name, paired, connected))
-
-                self.status_message = f"Found {len(devices)} device(s)"
+            if bluez_devices is not None:
+                devices = bluez_devices
             else:
-                self.status_message = "Failed to list devices"
-                # Fallback to demo device for testing
-                devices.append(BluetoothDevice("CC:C5:0A:27:5C:45", "Bluetooth Keyboard", paired=False, connected=False))
-
-        except subprocess.TimeoutExpired:
-            self.status_message = "Scan timeout"
-            # Fallback to demo device
-            devices.append(BluetoothDevice("CC:C5:0A:27:5C:45", "Bluetooth Keyboard", paired=False, connected=False))
+                # List devices and the paired subset in one round trip
+                stdout, paired_output = await self._cmds(["devices", "paired-devices"])
+                for mac, name in _parse_device_lines(stdout):
+                    devices.append(BluetoothDevice(mac, name))
+                await self._refresh_state(devices, paired_output)
+
+            self._save_cache(await self._adapter_address(), devices)
+
+            self.status_message = f"Found {len(devices)} device(s)"
+
         except Exception as e:
-            self.status_message = f"Scan error: {e}"
-            # Fallback to demo device
-            devices.append(BluetoothDevice("CC:C5:0A:27:5C:45", "Bluetooth Keyboard", paired=False, connected=False))
+            self._adapter_ok = False
+            if isinstance(e, asyncio.TimeoutError):
+                self.status_message = "Scan timeout"
+            else:
+                self.status_message = f"Scan error: {e}"
+            # Fallback to demo device, dropping any partial results
+            devices = [BluetoothDevice(DEMO_MAC, "Bluetooth Keyboard")]
 
         return devices
-    def pair_device(self, device: BluetoothDevice) -> bool:
+
+    async def _rescan(self):
+        """Refresh the device list in the background."""
+        if self._device_cache_ready:
+            # Show what BlueZ already knows while discovery runs
+            self.devices = list(self._device_cache.values())
+            self._device_lines = None
+        self.devices = await self.scan_devices()
+        self._device_lines = None
+        self.selected_index = 0
+
+    async def _load_or_scan(self):
+        """Show remembered devices if available, otherwise run a full scan."""
+        try:
+            cached = self._load_cache(await self._adapter_address())
+            if cached:
+                await self._refresh_state(cached)
+        except Exception:
+            cached = []
+
+        if cached:
+            self.devices = cached
+            self._device_lines = None
+            self.selected_index = 0
+            self.status_message = f"Loaded {len(cached)} known device(s), 'r' to rescan"
+        else:
+            await self._rescan()
+
+    def _start_scan(self):
+        """Start a background scan unless one is already running."""
+        if self._scan_task is None or self._scan_task.done():
+            self.status_message = "Scanning..."
+            self._scan_task = asyncio.create_task(self._rescan())
+
+    async def pair_device(self, device: BluetoothDevice) -> bool:
         """Pair with the Bluetooth device."""
         try:
             self.status_message = f"Pairing with {device.name}..."
 
             # For demo device, simulate successful pairing
-            if device.mac == "CC:C5:0A:27:5C:45":
-                time.sleep(2)  # Simulate pairing time
+            if device.mac == DEMO_MAC:
+                await asyncio.sleep(2)  # Simulate pairing time
                 self.status_message = f"Paired with {device.name}"
                 device.paired = True
+                self._device_lines = None
                 return True
 
-            # For real devices, use bluetoothctl
-            result = subprocess.run(
-                ["bluetoothctl", "pair", device.mac],
-                capture_output=True, text=True, timeout=30
-            )
+            # For real devices, wait for bluetoothctl to report the outcome
+            output = await self._cmd(f"pair {device.mac}", until=_PAIR_RESULT_RE, timeout=30)
 
-            if result.returncode == 0:
+            if b"Pairing successful" in output:
                 self.status_message = f"Paired with {device.name}"
                 device.paired = True
+                self._device_lines = None
                 return True
             else:
-                self.status_message = f"Failed to pair: {result.stderr.strip()}"
+                self.status_message = _PAIR_RESULT_RE.search(output).group(0).decode('utf-8', 'replace').strip()
                 return False
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.status_message = "Pairing timeout"
             return False
         except Exception as e:
             self.status_message = f"Pairing error: {e}"
             return False
 
-    def connect_device(self, device: BluetoothDevice) -> bool:
+    async def connect_device(self, device: BluetoothDevice) -> bool:
         """Connect to the Bluetooth device."""
         try:
             if not device.paired:
-                if not self.pair_device(device):
+                if not await self.pair_device(device):
                     return False
 
             self.status_message = f"Connecting to {device.name}..."
 
             # For demo device, simulate successful connection
-            if device.mac == "CC:C5:0A:27:5C:45":
-                time.sleep(1)  # Simulate connection time
+            if device.mac == DEMO_MAC:
+                await asyncio.sleep(1)  # Simulate connection time
                 self.status_message = f"Connected to {device.name}"
                 device.connected = True
                 return True
 
-            # For real devices, use bluetoothctl
-            result = subprocess.run(
-                ["bluetoothctl", "connect", device.mac],
-                capture_output=True, text=True, timeout=30
-            )
+            # For real devices, wait for bluetoothctl to report the outcome
+            output = await self._cmd(f"connect {device.mac}", until=_CONNECT_RESULT_RE, timeout=30)
 
-            if result.returncode == 0:
+            if b"Connection successful" in output:
                 self.status_message = f"Connected to {device.name}"
                 device.connected = True
                 return True
             else:
-                self.status_message = f"Failed to connect: {result.stderr.strip()}"
+                self.status_message = _CONNECT_RESULT_RE.search(output).group(0).decode('utf-8', 'replace').strip()
                 return False
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.status_message = "Connection timeout"
             return False
         except Exception as e:
             self.status_message = f"Connection error: {e}"
             return False
 
+    def _connecting(self) -> bool:
+        """Return whether a pair/connect attempt is in progress."""
+        return self._connect_task is not None and not self._connect_task.done()
+
+    def _build_device_lines(self) -> List[Tuple[str, str, str]]:
+        """Format the device rows once instead of on every redraw."""
+        lines = []
+        for device in self.devices:
+            paired_icon = self._ICON_PAIRED if device.paired else self._ICON_UNPAIRED
+            lines.append((
+                f"> {paired_icon} {device.name}",
+                f"  {paired_icon} {device.name}",
+                f"MAC: {device.mac}"
+            ))
+        return lines
+
+    def _build_chrome(self, height: int, width: int):
+        """Render the static title and instructions into a pad."""
+        self._chrome = curses.newpad(height, width)
+        self._chrome.addstr(0, (width - len(self._TITLE)) // 2, self._TITLE, curses.A_BOLD)
+        self._chrome.addstr(height - 2, (width - len(self._INSTRUCTIONS)) // 2, self._INSTRUCTIONS, curses.A_DIM)
+        self._chrome_size = (height, width)
+
     def draw_interface(self, stdscr):
         """Draw the Bluetooth connector interface."""
-        stdscr.clear()
         height, width = stdscr.getmaxyx()
 
-        # Title
-        title = "Bluetooth Device Connector 🐍📻"
-        stdscr.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
+        # Title and instructions; copying the pad also clears the rest
+        if self._chrome_size != (height, width):
+            self._build_chrome(height, width)
+        self._chrome.overwrite(stdscr, 0, 0, 0, 0, height - 1, width - 1)
 
         # Status
         if self.status_message:
-            status = self.status_message[:width-4]
+            status = self.status_message
+            if self._connecting():
+                status += f" {SPINNER[int(time.monotonic() / REDRAW_INTERVAL) % len(SPINNER)]}"
+            status = status[:width-4]
             stdscr.addstr(2, 2, f"Status: {status}")
 
         # Devices
@@ -175,54 +687,87 @@ class BluetoothConnector:
         if not self.devices:
             stdscr.addstr(start_y, 4, "No devices found. Press 'r' to rescan.")
         else:
-            for i, device in enumerate(self.devices):
+            if self._device_lines is None:
+                self._device_lines = self._build_device_lines()
+
+            for i, (selected_line, normal_line, details) in enumerate(self._device_lines):
                 y = start_y + i * 3
                 if y + 2 >= height:
                     break
 
-                # Device info
-                paired_icon = "🔗" if device.paired else "📱"
-
                 if i == self.selected_index:
-                    stdscr.addstr(y, 4, f"> {paired_icon} {device.name}", curses.A_REVERSE | curses.A_BOLD)
+                    stdscr.addstr(y, 4, selected_line, curses.A_REVERSE | curses.A_BOLD)
                 else:
-                    stdscr.addstr(y, 4, f"  {paired_icon} {device.name}")
+                    stdscr.addstr(y, 4, normal_line)
 
                 # Details
-                details = f"MAC: {device.mac}"
                 stdscr.addstr(y + 1, 6, details)
 
-        # Instructions
-        instructions = "↑↓ navigate, Enter connect, 'r' rescan, 'b' back, 'q' quit"
-        stdscr.addstr(height - 2, (width - len(instructions)) // 2, instructions, curses.A_DIM)
-
         stdscr.refresh()
 
-    def run_interface(self, stdscr):
+    def _view_state(self, stdscr) -> tuple:
+        """Everything draw_interface() depends on, to skip identical repaints."""
+        spinner = int(time.monotonic() / REDRAW_INTERVAL) if self._connecting() else None
+        return (
+            self.status_message, tuple(self.devices), self.selected_index,
+            self._device_lines, spinner, stdscr.getmaxyx()
+        )
+
+    async def run_interface(self, stdscr):
         """Run the interactive interface."""
         curses.curs_set(0)
         curses.start_color()
         curses.init_pair(1, curses.COLOR_BLUE, curses.COLOR_BLACK)
+        stdscr.nodelay(True)
 
-        # Initial scan
-        self.devices = self.scan_devices()
+        # Wake the main loop as soon as a key arrives instead of polling
+        loop = asyncio.get_running_loop()
+        self._key_ready = asyncio.Event()
+        loop.add_reader(sys.stdin.fileno(), self._key_ready.set)
 
+        # Initial load runs in the background so the UI keeps redrawing
+        self._scan_task = asyncio.create_task(self._load_or_scan())
+
+        try:
+            await self._main_loop(stdscr)
+        finally:
+            loop.remove_reader(sys.stdin.fileno())
+            for task in (self._scan_task, self._connect_task):
+                if task is not None:
+                    task.cancel()
+            await self.close()
+
+    async def _wait_for_key(self):
+        """Wait until stdin is readable or the redraw interval passes."""
+        try:
+            await asyncio.wait_for(self._key_ready.wait(), REDRAW_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _main_loop(self, stdscr):
+        """Handle input and redraws until the user leaves the interface."""
         while True:
-            self.draw_interface(stdscr)
+            if self._dirty:
+                # Devices changed under us via D-Bus signals
+                self._dirty.clear()
+                self._device_lines = None
+            if self._view_state(stdscr) != self._drawn_state:
+                self.draw_interface(stdscr)
+                self._drawn_state = self._view_state(stdscr)
 
             try:
+                self._key_ready.clear()
                 key = stdscr.getch()
 
-                if key == ord('b') or key == ord('B'):
+                if key == -1:
+                    # No input pending; redraw after the next key or interval
+                    await self._wait_for_key()
+                elif key == ord('b') or key == ord('B'):
                     return
                 elif key == ord('q') or key == ord('Q'):
-                    import sys
                     sys.exit(0)
                 elif key == ord('r') or key == ord('R'):
-                    self.status_message = "Scanning..."
-                    stdscr.refresh()
-                    self.devices = self.scan_devices()
-                    self.selected_index = 0
+                    self._start_scan()
                 elif key == curses.KEY_UP:
                     if self.devices:
                         self.selected_index = max(0, self.selected_index - 1)
@@ -230,22 +775,13 @@ class BluetoothConnector:
                     if self.devices:
                         self.selected_index = min(len(self.devices) - 1, self.selected_index + 1)
                 elif key == ord('\n') or key == ord('\r') or key == curses.KEY_ENTER:
-                    if self.devices and 0 <= self.selected_index < len(self.devices):
+                    if self.devices and 0 <= self.selected_index < len(self.devices) and not self._connecting():
+                        # Connect in the background; progress shows on the status line
                         device = self.devices[self.selected_index]
-                        curses.endwin()  # Exit curses for interaction
-                        if self.connect_device(device):
-                            print(f"Successfully connected to {device.name}")
-                        else:
-                            print(f"Failed to connect to {device.name}")
-                        print("\nReturning to menu...")
-                        time.sleep(2)
-                        curses.wrapper(self.run_interface)  # Re-enter curses
-                        return
+                        self._connect_task = asyncio.create_task(self.connect_device(device))
                 elif key == 27:  # ESC
                     return
 
-                time.sleep(0.05)
-
             except KeyboardInterrupt:
                 return
 
@@ -254,16 +790,14 @@ class BluetoothConnector:
         print("Bluetooth Device Connector")
         print("=========================")
 
-        # Check if bluetoothctl is available
-        try:
-            subprocess.run(["bluetoothctl", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check if bluetoothctl is available (a PATH lookup, no process needed)
+        if not shutil.which("bluetoothctl"):
             print("bluetoothctl not found. Please install bluez:")
             print("  sudo apt install bluez")
             return
 
         try:
-            curses.wrapper(self.run_interface)
+            curses.wrapper(lambda stdscr: asyncio.run(self.run_interface(stdscr)))
         except KeyboardInterrupt:
             print("\nBluetooth connector stopped by user")
         except Exception as e:
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Bluetooth Scan Daemon - SpectrumSnek 🐍📻
+
+Keeps discovery running in the background and publishes the device list
+to a snapshot file, so the connector can show devices without scanning.
+
+Run with: python -m bluetooth_tool.scand
+"""
+
+import asyncio
+import json
+import os
+import time
+
+from .bluetooth_connector import (
+    BluetoothConnector, BluetoothDevice, SNAPSHOT_FILE, _parse_device_lines
+)
+
+# Seconds between snapshot writes
+SNAPSHOT_INTERVAL = 5
+
+def write_snapshot(adapter: str, devices: list):
+    """Atomically replace the snapshot file with the current device list."""
+    snapshot = {
+        "adapter": adapter,
+        "timestamp": time.time(),
+        "devices": [
+            {"mac": d.mac, "name": d.name, "paired": d.paired, "connected": d.connected}
+            for d in devices
+        ]
+    }
+
+    os.makedirs(os.path.dirname(SNAPSHOT_FILE), exist_ok=True)
+    tmp_file = f"{SNAPSHOT_FILE}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_file, SNAPSHOT_FILE)
+
+async def main():
+    """Run discovery and refresh the snapshot until interrupted."""
+    connector = BluetoothConnector()
+    # bluetoothctl session discovery was last started in; the connector
+    # replaces the session after a failed command, and a new one isn't
+    # scanning
+    scan_session = None
+    try:
+        while True:
+            try:
+                adapter = await connector._adapter_address()
+                session = connector._btctl
+                if session is None or session is not scan_session or session.returncode is not None:
+                    await connector._cmd(f"scan {await connector._get_scan_mode()}")
+                    scan_session = connector._btctl
+
+                output, paired_output = await connector._cmds(["devices", "paired-devices"])
+                devices = [BluetoothDevice(mac, name) for mac, name in _parse_device_lines(output)]
+                await connector._refresh_state(devices, paired_output)
+                write_snapshot(adapter, devices)
+            except Exception as e:
+                # Keep the daemon alive; the next pass retries
+                print(f"Snapshot refresh failed: {e!r}")
+            await asyncio.sleep(SNAPSHOT_INTERVAL)
+    finally:
+        await connector.close()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nBluetooth scan daemon stopped by user")
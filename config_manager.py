@@ -4,9 +4,35 @@ SpectrumSnek Configuration Manager
 Handles loading, saving, and managing application configuration
 """
 
+import atexit
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+# Seconds of quiet after the last change before it is written to disk
+FLUSH_DELAY = 0.5
+
+# Managers whose unsaved changes are written when the interpreter exits;
+# held weakly so registering doesn't keep them alive
+_managers: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+def _flush_all():
+    """Save every live manager's pending changes at exit."""
+    for manager in list(_managers):
+        manager.flush()
+
+atexit.register(_flush_all)
 
 class ConfigManager:
     """Manages application configuration with persistence."""
@@ -14,35 +40,97 @@ class ConfigManager:
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
         self.config: Dict[str, Any] = {}
+        # Dot-separated key paths already split by get()
+        self._key_paths: Dict[str, tuple] = {}
+        # Read-only tool config views, with the dict each one wraps
+        self._tool_views: Dict[Optional[str], Tuple[Dict[str, Any], Mapping[str, Any]]] = {}
+        # Unsaved changes are written by a debounced timer or flush()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        self._batch_depth = 0
+        # Digest of the last contents read from or written to disk
+        self._last_hash: Optional[bytes] = None
         self.load_config()
+        _managers.add(self)
 
     def load_config(self) -> bool:
         """Load configuration from file."""
+        if not os.path.exists(self.config_file):
+            print(f"Configuration file {self.config_file} not found, using defaults")
+            self._create_default_config()
+            return False
+
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-                print(f"Loaded configuration from {self.config_file}")
-                return True
-            else:
-                print(f"Configuration file {self.config_file} not found, using defaults")
-                self._create_default_config()
-                return False
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson else json.loads(data)
         except Exception as e:
             print(f"Error loading configuration: {e}")
             self._create_default_config()
             return False
 
+        self.config = config
+        try:
+            self._last_hash = self._digest(self._serialize())
+        except (TypeError, ValueError):
+            # Parsed but not serializable the way it is saved (orjson
+            # rejects e.g. integers over 64 bits); keep it, and never
+            # treat a save as a no-op
+            self._last_hash = None
+        print(f"Loaded configuration from {self.config_file}")
+        return True
+
+    def _serialize(self) -> bytes:
+        """Serialize the configuration exactly as it is written to disk."""
+        if orjson:
+            return orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.config, indent=2).encode()
+
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
     def save_config(self) -> bool:
-        """Save current configuration to file."""
+        """Save current configuration to file.
+
+        Skips the write when the file already holds the same contents, and
+        otherwise swaps in a fully written temp file so readers never see
+        a partial config.
+        """
+        tmp_name = None
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = self._serialize()
+            digest = self._digest(data)
+            if digest == self._last_hash and os.path.exists(self.config_file):
+                self._dirty = False
+                return True
+
+            config_dir = os.path.dirname(os.path.abspath(self.config_file))
+            with tempfile.NamedTemporaryFile(dir=config_dir, prefix=".config-", delete=False) as f:
+                tmp_name = f.name
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # NamedTemporaryFile is private (0600); keep the usual file mode
+            try:
+                mode = os.stat(self.config_file).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_name, mode)
+            os.replace(tmp_name, self.config_file)
+            tmp_name = None
+
+            self._last_hash = digest
+            self._dirty = False
             print(f"Saved configuration to {self.config_file}")
             return True
         except Exception as e:
             print(f"Error saving configuration: {e}")
             return False
+        finally:
+            if tmp_name:
+                os.unlink(tmp_name)
 
     def _create_default_config(self):
         """Create default configuration."""
@@ -82,9 +170,13 @@ class ConfigManager:
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value by dot-separated key path."""
-        keys = key_path.split('.')
+        keys = self._key_paths.get(key_path)
+        if keys is None:
+            keys = self._key_paths[key_path] = tuple(key_path.split('.'))
         value = self.config
 
+        # Always walk the live tree, so changes made directly to the
+        # config dicts are seen too
         for key in keys:
             if isinstance(value, dict) and key in value:
                 value = value[key]
@@ -94,7 +186,12 @@ class ConfigManager:
         return value
 
     def set(self, key_path: str, value: Any) -> bool:
-        """Set configuration value by dot-separated key path."""
+        """Set configuration value by dot-separated key path.
+
+        Returns True once the value is set and its save is scheduled; the
+        file is written shortly after, and flush() reports whether that
+        write succeeded.
+        """
         keys = key_path.split('.')
         config = self.config
 
@@ -107,31 +204,102 @@ class ConfigManager:
         # Set the final value
         config[keys[-1]] = value
 
-        # Auto-save after setting
-        return self.save_config()
+        # Save shortly after the last change rather than on every set
+        self._schedule_flush()
+        return True
+
+    def _schedule_flush(self):
+        """Mark the configuration dirty and restart the debounced save."""
+        with self._flush_lock:
+            self._dirty = True
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._batch_depth:
+                return  # batch() saves on exit
+
+            self._flush_timer = threading.Timer(FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """Save the configuration now if it has unsaved changes.
+
+        Returns False if they could not be written; they stay pending, so
+        a failed deferred save is retried and reported here.
+        """
+        with self._flush_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            return self.save_config()
+
+    @contextmanager
+    def batch(self):
+        """Apply several changes and save them once when the block exits.
+
+        Raises OSError if the outermost block's changes can't be saved.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            saved = self._batch_depth > 0 or self.flush()
+        if not saved:
+            raise OSError(f"Could not save configuration to {self.config_file}")
 
     def get_service_config(self) -> Dict[str, Any]:
         """Get service-specific configuration."""
         return self.config.get('service', {})
 
-    def get_tool_config(self, tool_name: str) -> Dict[str, Any]:
-        """Get configuration for a specific tool."""
-        return self.config.get('tools', {}).get(tool_name, {})
+    def _tool_view(self, tool_name: Optional[str]) -> Mapping[str, Any]:
+        """Return a read-only view of one tool's config, or of all (None).
+
+        A view follows changes to the dict it wraps, so it is reused until
+        that dict is replaced (e.g. by update_tool_config() or a reload).
+        """
+        tools = self.config.get('tools', {})
+        config = tools if tool_name is None else tools.get(tool_name, {})
+        cached = self._tool_views.get(tool_name)
+        if cached is None or cached[0] is not config:
+            cached = self._tool_views[tool_name] = (config, MappingProxyType(config))
+        return cached[1]
+
+    def get_tool_config(self, tool_name: str) -> Mapping[str, Any]:
+        """Get configuration for a specific tool (read-only; pass a changed
+        dict() copy to update_tool_config())."""
+        return self._tool_view(tool_name)
 
     def update_tool_config(self, tool_name: str, config: Dict[str, Any]) -> bool:
-        """Update configuration for a specific tool."""
+        """Update configuration for a specific tool.
+
+        Like set(), returns True once the save is scheduled.
+        """
         if 'tools' not in self.config:
             self.config['tools'] = {}
 
         self.config['tools'][tool_name] = config
-        return self.save_config()
+        self._schedule_flush()
+        return True
+
+    def list_tools_config(self) -> Mapping[str, Any]:
+        """Get all tool configurations (read-only)."""
+        return self._tool_view(None)
 
-    def list_tools_config(self) -> Dict[str, Any]:
-        """Get all tool configurations."""
-        return self.config.get('tools', {})
+# Global configuration instance, created on first access so that importing
+# this module does not read (or write) config.json
+_instance: Optional[ConfigManager] = None
 
-# Global configuration instance
-config_manager = ConfigManager()
+def __getattr__(name: str) -> Any:
+    global _instance
+    if name == "config_manager":
+        if _instance is None:
+            _instance = ConfigManager()
+        return _instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Test the configuration manager
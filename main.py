@@ -16,19 +16,182 @@ Key Features:
 Usage:
     python main.py                    # Interactive menu
     python main.py --service-url URL  # Connect to service
+    python main.py --refresh-tools    # Ignore the cached tool list
     python main.py --help            # Show help
 """
 
 import sys
 import os
 import time
-import curses
-TEXTUAL_AVAILABLE = False
-import time
-from typing import List, Dict, Any
+import importlib
+import importlib.util
+import json
+import logging
+import queue
+import random
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+logger = logging.getLogger(__name__)
+
+# Add current directory to path, unless it is already there
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
+
+# Tools reported by the service on the last run, shown while it is asked again
+TOOLS_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "spectrumsnek", "tools.json")
+
+# Optional file in a plugin directory giving its menu name and description
+# as JSON, so the plugin needn't be imported to list it
+PLUGIN_MANIFEST = "plugin.json"
+
+# Plugin menu metadata from the last scan, keyed by plugin directory
+PLUGIN_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "spectrumsnek", "plugins.json")
+
+# Service replies worth retrying: rate limited, or not ready yet
+RETRY_STATUSES = frozenset((429, 503, 504))
+
+# Seconds after which service discovery stops retrying
+DISCOVERY_BUDGET = 2.5
+
+# How often the curses menu checks for discovery results, in milliseconds
+DISCOVERY_POLL_MS = 100
+
+# Seconds a repeated start of the same service tool is ignored for
+START_DEDUP_SECONDS = 2.0
+
+# Menu entries for the bundled plugins, so the menu can be built without
+# importing them; other plugins provide a plugin.json manifest or are
+# asked via their get_module_info()
+PLUGIN_MENU = {
+    "adsb_tool": (
+        "✈️ ADS-B Aircraft Tracker",
+        "Real-time aircraft tracking and surveillance using ADS-B signals - spot planes before you see them!"
+    ),
+    "demo_scanner": (
+        "🎭 Demo Spectrum Analyzer",
+        "Basic spectrum analysis demonstration - no hardware required"
+    ),
+    "radio_scanner": (
+        "📻 Traditional Radio Scanner",
+        "Scan through user-defined frequency lists with squelch support - classic radio monitoring"
+    ),
+    "rtl_scanner": (
+        "🐍 RTL-SDR Spectrum Analyzer",
+        "Real-time RTL-SDR radio spectrum scanner with demodulation - watch signals dance!"
+    ),
+}
+
+# Main menu header and footer text
+MENU_TITLE = "SpectrumSnek 🐍📻"
+MENU_SUBTITLE = "Choose your radio adventure!"
+MENU_INSTRUCTIONS = "↑↓ navigate, Enter select, 'q' quit"
+
+# Short menu names for the bundled tools
+_NAME_MAPPING = {
+    "✈️ ADS-B Aircraft Tracker": "ADS-B",
+    "📻 Traditional Radio Scanner": "Radio Scanner",
+    "🎭 Demo Spectrum Analyzer": "Demo Analyzer",
+    "🐍 RTL-SDR Spectrum Analyzer": "Spectrum Analyzer"
+}
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+@contextmanager
+def _key_mode(fd: int):
+    """Read keys one at a time without echo, and yield the previous terminal
+    attributes. Output processing and Ctrl+C are left working."""
+    import termios
+    import tty
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield old
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+def _read_key() -> str:
+    """Read one key from a terminal in _key_mode, decoding arrow keys."""
+    ch = sys.stdin.read(1)
+    if not ch:
+        raise EOFError
+    if ch == '\x1b':
+        ch2 = sys.stdin.read(1)
+        if ch2 == '[':
+            ch3 = sys.stdin.read(1)
+            if ch3 == 'A':
+                return 'up'
+            elif ch3 == 'B':
+                return 'down'
+            elif ch3 == 'C':
+                return 'right'
+            elif ch3 == 'D':
+                return 'left'
+    return ch
+
+def _backoff(attempt: int, base: float = 0.2, cap: float = 1.0) -> float:
+    """Delay before the next service retry, with full jitter: a random
+    fraction of an exponentially growing, capped window."""
+    return random.random() * min(cap, base * 2 ** attempt)
+
+def _plugin_mtime(plugin_dir: os.DirEntry) -> int:
+    """Newest mtime of a plugin directory, its __init__.py and manifest, in ns."""
+    mtime = plugin_dir.stat().st_mtime_ns
+    for name in ("__init__.py", PLUGIN_MANIFEST):
+        try:
+            mtime = max(mtime, os.stat(os.path.join(plugin_dir.path, name)).st_mtime_ns)
+        except OSError:
+            pass
+    return mtime
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+def _read_manifest(plugin_path: str) -> Optional[Dict[str, Any]]:
+    """Return a plugin's name/description manifest, if it ships a valid one."""
+    try:
+        with open(os.path.join(plugin_path, PLUGIN_MANIFEST), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or "name" not in manifest or "description" not in manifest:
+        return None
+    return manifest
+
+def lazy_import(name: str):
+    """Import a module whose top-level code only runs on first attribute access."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+def cached_import(module_path: str, attr: str):
+    """Return an attribute of a module, skipping the import machinery when
+    the module is already imported and has it."""
+    module = sys.modules.get(module_path)
+    if module is not None:
+        try:
+            return getattr(module, attr)
+        except AttributeError:
+            pass  # Possibly still being imported; let the import system wait
+    return getattr(importlib.import_module(module_path), attr)
 
 class ModuleInfo:
     """
@@ -49,6 +212,38 @@ class ModuleInfo:
         self.module_path = module_path
         self.run_function = run_function
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        # Selected/unselected menu rows; _prepare() formats them for a
+        # terminal width, and a changed name forces that again
+        self._prep_width = -1
+        self._name_sel = ""
+        self._name_unsel = ""
+
+    def _prepare(self, width: Optional[int]):
+        """Format the selected/unselected menu rows, cut to fit a terminal
+        width (None: full length)."""
+        limit = None if width is None else max(width - 3, 0)  # Rows start at column 2
+        self._name_sel = f"> {self._name}"[:limit]
+        self._name_unsel = f"  {self._name}"[:limit]
+        self._prep_width = width
+
+class _BackOption:
+    """The "Back" entry that ends the system tools submenu."""
+    __slots__ = ()
+    name = '⬅️ Back to Main Menu'
+    description = 'Return to the main SpectrumSnek menu'
+
+    def action(self):
+        pass
+
+_BACK_OPTION = _BackOption()
+
 class RadioToolsLoader:
     """Main loader with menu system for radio tools."""
 
@@ -57,128 +252,334 @@ class RadioToolsLoader:
         self.modules: List[ModuleInfo] = []
         self.selected_index = 0
         self.web_portal_enabled = True  # Global web portal toggle
+        # Menu entry labelled with the toggle state, if the menu has one
+        self.web_toggle_module: Optional[ModuleInfo] = None
+        # Display attributes, combined once by run_menu() instead of on
+        # every draw; curses itself is only imported by the curses menus
+        self._attr_title = 0
+        self._attr_selected = 0
+        self._attr_dim = 0
+        # Header, module list and footer windows, created by draw_menu()
+        self._header_win = None
+        self._list_win = None
+        self._footer_win = None
+        # Terminal size the windows were built for, and centring columns
+        # by terminal width
+        self._menu_size = None
+        self._layout_cache: Dict[int, tuple] = {}
+        # Module lists found by the background service discovery
+        self._module_updates: "queue.Queue[List[ModuleInfo]]" = queue.Queue()
+        self._discovery_thread: Optional[threading.Thread] = None
+        # Keep-alive HTTP session for service API calls, created on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+        # /api/tools request in flight, shared by concurrent _fetch_tools() calls
+        self._inflight = None
+        self._inflight_lock = threading.Lock()
+        # Background service requests (pool created on first use), and
+        # status lines they leave for the menu
+        self._executor = None
+        self._status: List[str] = []
+        self._status_lock = threading.Lock()
+        # When each service tool was last asked to start (monotonic time)
+        self._recent_starts: Dict[str, float] = {}
         self.load_modules()
 
-    def load_modules(self):
-        """Load available tools from service API with retry logic."""
-        try:
-            import requests
-        except ImportError:
-            print("⚠ Requests library not available, using local mode")
-            self.load_local_modules()
-            return
+    def _http(self):
+        """Return the shared requests session, or None without requests."""
+        with self._session_lock:
+            if self._session is None:
+                try:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                except ImportError:
+                    return None
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def _fetch_tools(self) -> Optional[Dict[str, Any]]:
+        """Ask the service for its tools; None if unreachable. Callers
+        arriving while a request is in flight share its result."""
+        from concurrent.futures import Future
+
+        with self._inflight_lock:
+            future = self._inflight
+            owner = future is None
+            if owner:
+                future = self._inflight = Future()
+        if not owner:
+            return future.result()
 
-        # Try multiple times to connect to service (handles startup timing)
-        max_retries = 3
+        try:
+            tools = self._request_tools()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(tools)
+            return tools
+        finally:
+            with self._inflight_lock:
+                self._inflight = None
+
+    def _request_tools(self) -> Optional[Dict[str, Any]]:
+        """GET /api/tools with retry logic; None if unreachable."""
+        session = self._http()
+        if session is None:
+            return None
+
+        import requests
+
+        # Let the service answer 304 Not Modified if the cached list is current
+        cache = self._read_tools_cache()
+        headers = {}
+        if cache is not None:
+            if cache.get("etag"):
+                headers['If-None-Match'] = cache["etag"]
+            if cache.get("last_modified"):
+                headers['If-Modified-Since'] = cache["last_modified"]
+
+        # Try multiple times to connect to service (handles startup timing),
+        # backing off between attempts within a short overall budget. Only
+        # failures that may clear up are retried.
+        deadline = time.monotonic() + DISCOVERY_BUDGET
+        max_retries = 6
         for attempt in range(max_retries):
             try:
-                print(f"Attempting to connect to SpectrumSnek service at {self.service_url}... (attempt {attempt + 1}/{max_retries})")
-                response = requests.get(f"{self.service_url}/api/tools", timeout=5)
+                response = session.get(f"{self.service_url}/api/tools", headers=headers,
+                                       timeout=self._timeout())
+                if response.status_code == 304 and cache is not None:
+                    return cache["tools"]
                 if response.status_code == 200:
-                    print("✓ Successfully connected to service")
-                    data = response.json()
-                    for tool_name, tool_data in data['tools'].items():
-                        info = tool_data['info']
-                        self.modules.append(ModuleInfo(
-                            info["name"],
-                            info["description"],
-                            tool_name,
-                            lambda name=tool_name: self.start_tool(name)
-                        ))
-                    print(f"✓ Loaded {len(data.get('tools', {}))} tools from service")
-                    return  # Success, exit the retry loop
-                else:
-                    print(f"⚠ Service responded with status {response.status_code}")
-                    if attempt < max_retries - 1:
-                        print("   Retrying in 2 seconds...")
-                        time.sleep(2)
-                    else:
-                        print("   Falling back to local mode")
-                        self.load_local_modules()
-            except requests.exceptions.ConnectionError as e:
-                if attempt < max_retries - 1:
-                    print(f"⚠ Cannot connect to service (attempt {attempt + 1}), retrying in 2 seconds...")
-                    time.sleep(2)
-                else:
-                    print(f"⚠ Cannot connect to service after {max_retries} attempts, using local mode")
-                    self.load_local_modules()
-            except requests.exceptions.Timeout:
-                if attempt < max_retries - 1:
-                    print(f"⚠ Service connection timed out (attempt {attempt + 1}), retrying in 2 seconds...")
-                    time.sleep(2)
-                else:
-                    print("⚠ Service connection timed out, using local mode")
-                    self.load_local_modules()
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"⚠ Service connection failed (attempt {attempt + 1}): {e}, retrying in 2 seconds...")
-                    time.sleep(2)
-                else:
-                    print(f"⚠ Service connection failed after {max_retries} attempts, using local mode")
-                    self.load_local_modules()
-
+                    tools = _json_loads(response.content)['tools']
+                    self._save_cached_tools(tools, response.headers.get('ETag'),
+                                            response.headers.get('Last-Modified'))
+                    return tools
+                if response.status_code not in RETRY_STATUSES:
+                    return None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                pass
+            except Exception:
+                return None
+            delay = _backoff(attempt)
+            if attempt == max_retries - 1 or time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
+        return None
+
+    def _timeout(self):
+        """(connect, read) timeout for discovery; a loopback service answers
+        at once or not at all."""
+        if urlparse(self.service_url).hostname in ('127.0.0.1', 'localhost'):
+            return (0.3, 2.0)
+        return (1.0, 5.0)
+
+    def _modules_from_tools(self, tools: Dict[str, Any]) -> List[ModuleInfo]:
+        """Build menu entries for tools reported by the service."""
+        return [
+            ModuleInfo(
+                tool_data['info']["name"],
+                tool_data['info']["description"],
+                tool_name,
+                lambda name=tool_name: self.start_tool(name)
+            )
+            for tool_name, tool_data in tools.items()
+        ]
+
+    def _read_tools_cache(self) -> Optional[Dict[str, Any]]:
+        """Return the cached /api/tools reply for this service, if any."""
+        try:
+            with open(TOOLS_CACHE_FILE, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("service_url") != self.service_url:
+            return None
+        return cache
+
+    def _load_cached_tools(self) -> bool:
+        """Fill the menu from the tools the service reported last time."""
+        cache = self._read_tools_cache()
+        if cache is None:
+            return False
+        try:
+            self.modules = self._modules_from_tools(cache["tools"])
+        except (KeyError, TypeError, AttributeError):
+            return False
+        return bool(self.modules)
+
+    def _save_cached_tools(self, tools: Dict[str, Any], etag: Optional[str] = None,
+                           last_modified: Optional[str] = None):
+        """Remember the service's tools, and its validators, for the next start."""
+        try:
+            os.makedirs(os.path.dirname(TOOLS_CACHE_FILE), exist_ok=True)
+            tmp_file = f"{TOOLS_CACHE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    "service_url": self.service_url,
+                    "fetched_at": time.time(),
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "tools": tools
+                }, f)
+            os.replace(tmp_file, TOOLS_CACHE_FILE)
+        except OSError:
+            pass
+
+    def _discover_async(self):
+        """Start asking the service for its tools without blocking the menu."""
+        if self._discovery_thread is not None and self._discovery_thread.is_alive():
+            return  # Its result is still on the way
+        self._discovery_thread = threading.Thread(target=self._load_modules_bg, daemon=True)
+        self._discovery_thread.start()
+
+    def _load_modules_bg(self):
+        """Discovery thread: queue the service's tools. If it can't be
+        reached the menu keeps what load_modules() showed: the cached tools,
+        or the local ones, scanned while the request was in flight."""
+        tools = self._fetch_tools()
+        if tools is not None:
+            self._module_updates.put(self._modules_from_tools(tools))
+
+    def apply_module_updates(self) -> bool:
+        """Swap in a module list found by discovery; True if the menu changed."""
+        changed = False
+        while True:
+            try:
+                modules = self._module_updates.get_nowait()
+            except queue.Empty:
+                return changed
+            if [m.module_path for m in modules] != [m.module_path for m in self.modules]:
+                self.modules = modules
+                self.selected_index = max(min(self.selected_index, len(modules) - 1), 0)
+                changed = True
+
+    def discovery_pending(self) -> bool:
+        """True while service discovery may still change the module list."""
+        return ((self._discovery_thread is not None and self._discovery_thread.is_alive())
+                or not self._module_updates.empty())
 
+    def load_modules(self):
+        """Show the cached (or local) tools at once and refresh them from the
+        service in the background."""
+        # Send the request first so it overlaps reading the cache or
+        # scanning the plugins; its result only arrives via the queue
+        self._discover_async()
+        if not self._load_cached_tools():
+            self.load_local_modules()
 
     def load_local_modules(self):
         """Fallback: Load available modules locally."""
+        self.modules.extend(self._local_modules())
+
+    def _local_modules(self) -> List[ModuleInfo]:
+        """Build menu entries for the plugins and tools shipped locally."""
+        modules: List[ModuleInfo] = []
         plugins_dir = "plugins"
 
-        # Load plugins dynamically
+        # Load plugins dynamically, importing only those whose metadata
+        # isn't cached yet or whose files changed since it was cached
+        cache = self._load_plugin_cache(plugins_dir)
+        fresh = {}
         if os.path.exists(plugins_dir):
-            for item in os.listdir(plugins_dir):
-                plugin_path = os.path.join(plugins_dir, item)
-                if os.path.isdir(plugin_path) and not item.startswith('__') and item != "system_tools":
+            # scandir's entries know their type without a stat per plugin
+            with os.scandir(plugins_dir) as entries:
+                for dir_entry in entries:
+                    item = dir_entry.name
+                    if (not dir_entry.is_dir()
+                            or item.startswith('__') or item == "system_tools"):
+                        continue
                     try:
-                        # Import the plugin module
-                        plugin_module = __import__(f"{plugins_dir}.{item}", fromlist=[item])
-                        info = plugin_module.get_module_info()
+                        module_path = f"{plugins_dir}.{item}"
+                        if item in PLUGIN_MENU:
+                            # Bundled plugins are a dict lookup; keeping them
+                            # out of the cache means edits to PLUGIN_MENU show
+                            name, description = PLUGIN_MENU[item]
+                        else:
+                            mtime = _plugin_mtime(dir_entry)
+                            entry = cache.get(item)
+                            if entry is None or entry.get("mtime") != mtime:
+                                entry = self._plugin_meta(module_path, dir_entry.path)
+                                entry["mtime"] = mtime
+                            fresh[item] = entry
+                            name, description = entry["name"], entry["description"]
+
+                        # Always run in text mode to avoid curses compatibility issues;
+                        # the plugin is imported once selected
+                        run_function = lambda path=module_path: cached_import(path, "run")("--text")
+
                         # Use short names for cleaner menu display
-                        short_name = self._get_short_name(info["name"])
-                        # Check for remote session to avoid curses issues
-                        # Only treat as remote if we have SSH_TTY (actual remote session)
-                        # SSH_CLIENT/SSH_CONNECTION can be preserved by sudo but SSH_TTY indicates actual remote
-                        is_remote = 'SSH_TTY' in os.environ
-                        # If running as root with SSH vars but no SSH_TTY, it's likely sudo (treat as local)
-                        if is_remote and os.geteuid() == 0 and 'SSH_TTY' not in os.environ:
-                            is_remote = False
-
-                        # Always run in text mode to avoid curses compatibility issues
-                        run_function = lambda run_func=plugin_module.run: run_func("--text")
-
-                        self.modules.append(ModuleInfo(
-                            short_name,
-                            info["description"],
-                            f"{plugins_dir}.{item}",
+                        modules.append(ModuleInfo(
+                            self._get_short_name(name),
+                            description,
+                            module_path,
                             run_function
                         ))
-                    except (ImportError, Exception):
-                        # Plugin not available or other errors, skip silently
-                        pass
+                    except Exception as e:
+                        # Plugin not available or broken; leave it out of the menu
+                        logger.debug("plugin %s skipped: %s", item, e)
+
+            if fresh != cache:
+                self._save_plugin_cache(plugins_dir, fresh)
 
         # System tools submenu
-        self.modules.append(ModuleInfo(
+        modules.append(ModuleInfo(
             "System Tools",
             "WiFi, Bluetooth, and system utilities",
             "system_tools",
             lambda: self.run_local_tool("system_tools")
         ))
+        return modules
+
+    def _plugin_meta(self, module_path: str, plugin_path: str) -> Dict[str, Any]:
+        """Menu metadata for a plugin that isn't in PLUGIN_MENU, importing it
+        only if it has no plugin.json manifest."""
+        manifest = _read_manifest(plugin_path)
+        if manifest is not None:
+            return {"name": manifest["name"], "description": manifest["description"]}
+        info = lazy_import(module_path).get_module_info()
+        return {"name": info["name"], "description": info["description"]}
+
+    def _load_plugin_cache(self, plugins_dir: str) -> Dict[str, Dict[str, Any]]:
+        """Read cached metadata for a plugins directory, keyed by plugin name."""
+        try:
+            with open(PLUGIN_CACHE_FILE, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("plugins_dir") != os.path.abspath(plugins_dir):
+            return {}
+        plugins = cache.get("plugins")
+        return plugins if isinstance(plugins, dict) else {}
+
+    def _save_plugin_cache(self, plugins_dir: str, cache: Dict[str, Dict[str, Any]]):
+        """Atomically replace the plugin metadata cache."""
+        try:
+            os.makedirs(os.path.dirname(PLUGIN_CACHE_FILE), exist_ok=True)
+            tmp_file = f"{PLUGIN_CACHE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    "plugins_dir": os.path.abspath(plugins_dir),
+                    "plugins": cache
+                }, f)
+            os.replace(tmp_file, PLUGIN_CACHE_FILE)
+        except OSError:
+            pass
 
     def show_system_tools_submenu(self):
         """Show system tools as a submenu with arrow key navigation like main menu."""
+        import curses
         from plugins.system_tools.system_menu import SystemMenu
 
         # Create system tools menu
         system_menu = SystemMenu()
 
-        # Add a "Back" option
-        back_option = type('Tool', (), {
-            'name': '⬅️ Back to Main Menu',
-            'description': 'Return to the main SpectrumSnek menu',
-            'action': lambda: None
-        })()
-
         # Combine tools with back option
-        all_options = system_menu.tools + [back_option]
+        all_options = [*system_menu.tools, _BACK_OPTION]
 
         # Create a temporary menu interface
         class SubMenu:
@@ -186,10 +587,15 @@ class RadioToolsLoader:
                 self.parent = parent
                 self.options = options
                 self.selected_index = 0
+                self.last_index = len(options) - 1
+                # (selected, unselected) row strings, formatted once
+                self._rows = [(f"> {o.name}", f"  {o.name}") for o in options]
 
             def draw_menu(self, stdscr):
                 """Draw the submenu interface."""
-                stdscr.clear()
+                # erase() only blanks the virtual screen; refresh() then sends
+                # just the cells that differ from what the terminal shows
+                stdscr.erase()
                 height, width = stdscr.getmaxyx()
 
                 # Title
@@ -201,44 +607,65 @@ class RadioToolsLoader:
                 stdscr.addstr(2, (width - len(subtitle)) // 2, subtitle, curses.A_DIM)
 
                 # Tools list (names only)
-                start_y = 4
-                for i, option in enumerate(self.options):
-                    y = start_y + i  # Clean spacing without extra lines
-                    if y >= height:
-                        break
-
-                    if i == self.selected_index:
-                        # Selected item (highlighted)
-                        stdscr.addstr(y, 4, f"> {option.name}", curses.A_REVERSE | curses.A_BOLD)
-                    else:
-                        # Normal item
-                        stdscr.addstr(y, 4, f"  {option.name}")
+                for i in range(len(self.options)):
+                    self._draw_row(stdscr, i)
 
                 stdscr.refresh()
 
+            def _draw_row(self, stdscr, i):
+                """Draw one tool row, highlighted if selected."""
+                y = 4 + i  # Clean spacing without extra lines
+                if y >= stdscr.getmaxyx()[0]:
+                    return
+
+                selected_row, normal_row = self._rows[i]
+                if i == self.selected_index:
+                    # Selected item (highlighted)
+                    stdscr.addstr(y, 4, selected_row, self.attr_selected)
+                else:
+                    # Normal item
+                    stdscr.addstr(y, 4, normal_row)
+
             def run_menu(self, stdscr):
                 """Run the submenu interface."""
                 curses.curs_set(0)
+                self.attr_selected = curses.A_REVERSE | curses.A_BOLD
+                # Sleep in getch() until a key arrives
+                stdscr.timeout(-1)
 
-                while True:
-                    self.draw_menu(stdscr)
+                # Full draw on entry, resize and return from a tool; moving
+                # the selection only repaints the two affected rows
+                self.draw_menu(stdscr)
 
+                while True:
                     try:
                         key = stdscr.getch()
 
                         if key == ord('q') or key == ord('Q'):
                             return  # Quit
-                        elif key == curses.KEY_UP:
-                            self.selected_index = max(0, self.selected_index - 1)
-                        elif key == curses.KEY_DOWN:
-                            self.selected_index = min(len(self.options) - 1, self.selected_index + 1)
+                        elif key == curses.KEY_UP or key == curses.KEY_DOWN:
+                            old_index = self.selected_index
+                            if key == curses.KEY_UP:
+                                self.selected_index = max(0, old_index - 1)
+                            else:
+                                self.selected_index = min(self.last_index, old_index + 1)
+                            if self.selected_index != old_index:
+                                self._draw_row(stdscr, old_index)
+                                self._draw_row(stdscr, self.selected_index)
+                                stdscr.refresh()
+                        elif key == curses.KEY_RESIZE:
+                            self.draw_menu(stdscr)
                         elif key == ord('\n') or key == ord('\r') or key == curses.KEY_ENTER:
                             selected_option = self.options[self.selected_index]
 
-                            if selected_option == back_option:
+                            if selected_option is _BACK_OPTION:
                                 # Back to main menu
                                 return
                             else:
+                                # Save the menu's terminal modes so it can be
+                                # resumed without re-initializing curses
+                                curses.def_prog_mode()
+
                                 # Run the selected tool
                                 try:
                                     # Clear screen for tool output
@@ -251,23 +678,23 @@ class RadioToolsLoader:
                                     print("\nPress Enter to return to menu...")
                                     input()
 
-                                    # Restart curses for menu
-                                    stdscr = curses.initscr()
-                                    curses.noecho()
-                                    curses.cbreak()
-                                    stdscr.keypad(True)
-
                                 except Exception as e:
-                                    curses.endwin()
                                     print(f"Error running {selected_option.name}: {e}")
                                     print("Press Enter to continue...")
                                     input()
-                                    stdscr = curses.initscr()
-                                    curses.noecho()
-                                    curses.cbreak()
-                                    stdscr.keypad(True)
 
-                        time.sleep(0.05)
+                                # Resume the menu in the same curses session;
+                                # tools running their own curses.wrapper share
+                                # stdscr and leave echo/keypad/nodelay changed
+                                curses.reset_prog_mode()
+                                curses.noecho()
+                                curses.cbreak()
+                                stdscr.keypad(True)
+                                stdscr.nodelay(False)
+                                # The tool's output is on the terminal, so
+                                # repaint everything rather than diffing
+                                stdscr.clear()
+                                self.draw_menu(stdscr)
 
                     except KeyboardInterrupt:
                         return
@@ -285,7 +712,8 @@ class RadioToolsLoader:
     def _show_system_tools_text_fallback(self, system_menu):
         """Fallback text menu for system tools with arrow key navigation."""
         selected = 0
-        all_options = system_menu.tools + [type('Tool', (), {'name': '⬅️ Back to Main Menu', 'description': 'Return to the main SpectrumSnek menu', 'action': lambda: None})()]
+        all_options = [*system_menu.tools, _BACK_OPTION]
+        n = len(all_options)
 
         while True:
             print("\n" + "="*50)
@@ -310,12 +738,12 @@ class RadioToolsLoader:
                     print("Returning to main menu...")
                     return
                 elif key == 'up':
-                    selected = (selected - 1) % len(all_options)
+                    selected = (selected - 1) % n
                 elif key == 'down':
-                    selected = (selected + 1) % len(all_options)
+                    selected = (selected + 1) % n
                 elif key in ['\r', '\n']:
                     selected_option = all_options[selected]
-                    if selected_option.name == '⬅️ Back to Main Menu':
+                    if selected_option is _BACK_OPTION:
                         print("Returning to main menu...")
                         return
                     else:
@@ -331,7 +759,7 @@ class RadioToolsLoader:
                 elif key.isdigit():
                     # Also support number input for compatibility
                     idx = int(key) - 1
-                    if 0 <= idx < len(system_menu.tools):
+                    if 0 <= idx < n - 1:  # Tools only, not Back
                         selected_option = system_menu.tools[idx]
                         print(f"\nSelected: {selected_option.name}")
                         print("-" * (len(selected_option.name) + 10))
@@ -355,22 +783,17 @@ class RadioToolsLoader:
         """Run a tool locally for interaction."""
         try:
             if tool_name in ["rtl_scanner", "adsb_tool", "radio_scanner"]:
-                import importlib
-                mod = importlib.import_module(f"plugins.{tool_name}")
-                mod.run()
+                cached_import(f"plugins.{tool_name}", "run")()
             elif tool_name == "adsb_service":
                 # ADS-B service runs locally through adsb_tool
-                import plugins.adsb_tool as adsb_tool
-                adsb_tool.run()
+                cached_import("plugins.adsb_tool", "run")()
             elif tool_name == "system_tools":
                 # Handle system tools as a submenu within the main menu
                 self.show_system_tools_submenu()
             elif tool_name == "demo_scanner":
-                from plugins.demo_scanner import run
-                run()
+                cached_import("plugins.demo_scanner", "run")()
             elif tool_name == "audio_tool":
-                from plugins.system_tools.audio_output_selector import AudioOutputSelector
-                AudioOutputSelector().run()
+                cached_import("plugins.system_tools.audio_output_selector", "AudioOutputSelector")().run()
             else:
                 print(f"Local run not available for {tool_name}")
         except ImportError as e:
@@ -387,27 +810,57 @@ class RadioToolsLoader:
             time.sleep(3)
             return
 
+        # A repeated selection while the first start is still fresh is a
+        # double press, not a request for a second instance
+        now = time.monotonic()
+        if now - self._recent_starts.get(tool_name, float('-inf')) < START_DEDUP_SECONDS:
+            print(f"{tool_name} is already starting")
+            return
+        self._recent_starts[tool_name] = now
+
+        # The tool runs on the service, so don't hold up the menu for the
+        # request; the outcome is shown on the next menu redraw
+        print(f"Starting {tool_name} on the service...")
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=2)
+        future = self._executor.submit(self._post_start, tool_name)
+        future.add_done_callback(lambda f: self._notify(f.result()))
+
+    def _post_start(self, tool_name: str) -> str:
+        """Ask the service to start a tool; return a status message."""
         try:
-            import requests
-            response = requests.post(f"{self.service_url}/api/tools/{tool_name}/start", timeout=10)
+            session = self._http()
+            if session is None:
+                raise RuntimeError("requests library not available")
+            # Starting a tool can take a while, so only the connect part of
+            # the discovery timeout applies
+            connect_timeout = self._timeout()[0]
+            response = session.post(f"{self.service_url}/api/tools/{tool_name}/start",
+                                    timeout=(connect_timeout, 10.0))
             if response.status_code == 200:
-                print(f"Started {tool_name}")
-            else:
-                print(f"Failed to start {tool_name}: {response.text}")
+                return f"Started {tool_name}"
+            message = f"Failed to start {tool_name}: {response.text}"
         except Exception as e:
-            print(f"Failed to start {tool_name}: {e}")
-        print("Returning to menu in 3 seconds...")
-        time.sleep(3)
+            message = f"Failed to start {tool_name}: {e}"
+        # Let a retry after a failure through straight away
+        self._recent_starts.pop(tool_name, None)
+        return message
+
+    def _notify(self, message: str):
+        """Queue a one-off status line for the next menu redraw."""
+        with self._status_lock:
+            self._status.append(message)
+
+    def _take_status(self) -> List[str]:
+        """Return and clear the pending status lines."""
+        with self._status_lock:
+            status, self._status = self._status, []
+        return status
 
     def _get_short_name(self, full_name: str) -> str:
         """Convert full tool names to short display names for cleaner menu."""
-        name_mapping = {
-            "✈️ ADS-B Aircraft Tracker": "ADS-B",
-            "📻 Traditional Radio Scanner": "Radio Scanner",
-            "🎭 Demo Spectrum Analyzer": "Demo Analyzer",
-            "🐍 RTL-SDR Spectrum Analyzer": "Spectrum Analyzer"
-        }
-        return name_mapping.get(full_name, full_name)
+        return _NAME_MAPPING.get(full_name, full_name)
 
     def toggle_web_portal(self):
         """Toggle web portal on/off."""
@@ -418,74 +871,146 @@ class RadioToolsLoader:
         time.sleep(3)
 
         # Update the menu item name
-        for module in self.modules:
-            if module.module_path == "web_toggle":
-                module.name = f"Web Portal: {'ON' if self.web_portal_enabled else 'OFF'}"
-                break
+        module = self.web_toggle_module
+        if module is not None:
+            module.name = f"Web Portal: {'ON' if self.web_portal_enabled else 'OFF'}"
 
     def draw_menu(self, stdscr):
-        """Draw the main menu."""
-        stdscr.clear()
+        """Draw the whole main menu (on entry and after a resize).
+
+        The static title and instructions live in their own windows, so
+        selection changes only touch the module list window. They are only
+        rebuilt when the terminal size changes; otherwise just the list is
+        redrawn. Windows are only staged with noutrefresh(); run_menu()
+        calls doupdate().
+        """
+        import curses
         height, width = stdscr.getmaxyx()
 
-        # Fallback for narrow terminals
-        if width < 40:
-            width = 80  # Default fallback
+        if (height, width) != self._menu_size or self._list_win is None:
+            stdscr.erase()
+            stdscr.noutrefresh()
 
-        # Title
-        title = "SpectrumSnek 🐍📻"
-        stdscr.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
+            self._header_win = curses.newwin(3, width, 0, 0)
+            self._list_win = curses.newwin(max(height - 5, 1), width, 4, 0)
+            self._footer_win = curses.newwin(1, width, height - 1, 0)
+            self._menu_size = (height, width)
+            title_x, subtitle_x, instructions_x = self._layout(width)
 
-        # Subtitle
-        subtitle = "Choose your radio adventure!"
-        stdscr.addstr(2, (width - len(subtitle)) // 2, subtitle)
+            # Title
+            self._header_win.addstr(0, title_x, MENU_TITLE, self._attr_title)
 
-        # Simple layout for all connections
-        start_y = 4
-        for i, module in enumerate(self.modules):
-            y = start_y + i
-            if y >= height:
-                break
+            # Subtitle
+            self._header_win.addstr(2, subtitle_x, MENU_SUBTITLE)
+            self._header_win.noutrefresh()
 
-            # Module name with selection indicator
-            if i == self.selected_index:
-                stdscr.addstr(y, 2, f"> {module.name}", curses.A_REVERSE | curses.A_BOLD)
-            else:
-                stdscr.addstr(y, 2, f"  {module.name}")
+            # Instructions
+            self._footer_win.addstr(0, instructions_x, MENU_INSTRUCTIONS, self._attr_dim)
+            self._footer_win.noutrefresh()
+        else:
+            # Same size: only the module list can have changed
+            self._list_win.erase()
 
-        # Instructions
-        instructions = "↑↓ navigate, Enter select, 'q' quit"
-        stdscr.addstr(height - 1, (width - len(instructions)) // 2, instructions, curses.A_DIM)
+        # Simple layout for all connections
+        for i in range(len(self.modules)):
+            self._draw_row(i)
+        self._list_win.noutrefresh()
+
+    def _layout(self, width: int):
+        """Columns centring the title, subtitle and instructions at a width."""
+        layout = self._layout_cache.get(width)
+        if layout is None:
+            layout = self._layout_cache[width] = tuple(
+                max((width - len(text)) // 2, 0)
+                for text in (MENU_TITLE, MENU_SUBTITLE, MENU_INSTRUCTIONS)
+            )
+        return layout
+
+    def _draw_row(self, i: int):
+        """Draw one module row into the list window, highlighted if selected."""
+        height, width = self._list_win.getmaxyx()
+        if i >= height:
+            return
 
-        stdscr.refresh()
+        # Module name with selection indicator
+        module = self.modules[i]
+        if module._prep_width != width:
+            module._prepare(width)
+        if i == self.selected_index:
+            self._list_win.addstr(i, 2, module._name_sel, self._attr_selected)
+        else:
+            self._list_win.addstr(i, 2, module._name_unsel)
+
+    def update_selection(self, stdscr, old: int, new: int):
+        """Repaint only the rows whose highlight changed."""
+        if old == new:
+            return
+        self._draw_row(old)
+        self._draw_row(new)
+        self._list_win.noutrefresh()
 
     def run_menu(self, stdscr):
         """Run the menu system."""
+        import curses
+        self._attr_title = curses.A_BOLD
+        self._attr_selected = curses.A_REVERSE | curses.A_BOLD
+        self._attr_dim = curses.A_DIM
         curses.curs_set(0)  # Hide cursor
         curses.start_color()
         curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Web portal enabled
-        stdscr.nodelay(True)  # Non-blocking input
+        # Block in getch() until a key arrives; Ctrl+C still raises
+        # KeyboardInterrupt from the wait
+        stdscr.timeout(-1)
+
+        # Full draw once; afterwards only changed rows are repainted. Each
+        # curses session starts on a fresh screen, so rebuild the windows
+        self._menu_size = None
+        self.draw_menu(stdscr)
+        dirty = True
+        last_index = len(self.modules) - 1
+        polling = False
 
         while True:
-            self.draw_menu(stdscr)
-
             # Handle input
             try:
+                # While discovery runs, wake up regularly to pick up its result
+                if self.discovery_pending():
+                    if not polling:
+                        stdscr.timeout(DISCOVERY_POLL_MS)
+                        polling = True
+                    if self.apply_module_updates():
+                        self.draw_menu(stdscr)
+                        dirty = True
+                        last_index = len(self.modules) - 1
+                elif polling:
+                    stdscr.timeout(-1)
+                    polling = False
+                # Push everything staged since the last key in one write;
+                # keys that changed nothing (mouse, unbound) skip the update
+                if dirty:
+                    curses.doupdate()
+                    dirty = False
                 key = stdscr.getch()
 
                 if key == ord('q') or key == ord('Q'):
                     return None  # Quit
-                elif key == curses.KEY_UP:
-                    self.selected_index = max(0, self.selected_index - 1)
-                elif key == curses.KEY_DOWN:
-                    self.selected_index = min(len(self.modules) - 1, self.selected_index + 1)
+                elif key == curses.KEY_UP or key == curses.KEY_DOWN:
+                    old_index = self.selected_index
+                    if key == curses.KEY_UP:
+                        self.selected_index = max(0, old_index - 1)
+                    else:
+                        self.selected_index = min(last_index, old_index + 1)
+                    if self.selected_index != old_index:
+                        self.update_selection(stdscr, old_index, self.selected_index)
+                        dirty = True
+                elif key == curses.KEY_RESIZE:
+                    self.draw_menu(stdscr)
+                    dirty = True
                 elif key == ord('\n') or key == ord('\r') or key == curses.KEY_ENTER:
                     return self.modules[self.selected_index]  # Selected module
                 elif key == 27:  # ESC
                     return None  # Quit
 
-                time.sleep(0.05)  # Small delay to prevent high CPU usage
-
             except KeyboardInterrupt:
                 return None
 
@@ -508,6 +1033,7 @@ class RadioToolsLoader:
 
     def run(self):
         """Main run loop."""
+        import curses
         curses.wrapper(self.run_curses_menu)
 
     def getch(self):
@@ -538,28 +1064,10 @@ class RadioToolsLoader:
             print("Non-interactive session detected, exiting menu...")
             return 'q'
         try:
-            import tty
-            import termios
-            fd = sys.stdin.fileno()
-            old = termios.tcgetattr(fd)
-            try:
-                tty.setraw(fd)
-                ch = sys.stdin.read(1)
-                if ch == '\x1b':
-                    ch2 = sys.stdin.read(1)
-                    if ch2 == '[':
-                        ch3 = sys.stdin.read(1)
-                        if ch3 == 'A':
-                            return 'up'
-                        elif ch3 == 'B':
-                            return 'down'
-                        elif ch3 == 'C':
-                            return 'right'
-                        elif ch3 == 'D':
-                            return 'left'
-                return ch
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old)
+            with _key_mode(sys.stdin.fileno()):
+                return _read_key()
+        except (EOFError, KeyboardInterrupt):
+            return 'q'
         except:
             # Fallback to input for number selection
             try:
@@ -570,48 +1078,71 @@ class RadioToolsLoader:
 
     def text_menu_loop(self):
         """Text-based menu loop with arrow key support."""
-        selected = 0
-        while True:
-            print("\n" + "="*50)
-            print("SpectrumSnek")
-            print("="*50)
-            print("Available tools:")
-            
-            for i, module in enumerate(self.modules):
-                marker = ">" if i == selected else " "
-                print(f"  {marker} {module.name}")
-            
-            print("\n  ↑↓ navigate, Enter select, 'q' quit")
-            print("="*50)
-            
-            try:
-                key = self.get_key()
-                
-                if key == 'q' or key == 'Q':
-                    break
-                elif key == 'up':
-                    selected = (selected - 1) % len(self.modules)
-                elif key == 'down':
-                    selected = (selected + 1) % len(self.modules)
-                elif key in ['\r', '\n']:
-                    selected_module = self.modules[selected]
-                    self.run_selected_module_text(selected_module)
-                elif key.isdigit():
-                    idx = int(key) - 1
-                    if 0 <= idx < len(self.modules):
-                        selected_module = self.modules[idx]
-                        self.run_selected_module_text(selected_module)
+        if not sys.stdin.isatty():
+            print("Non-interactive session detected, exiting menu...")
+            return
+
+        # Keys are read unbuffered for the whole menu session; the terminal
+        # only goes back to line mode while a tool runs
+        fd = sys.stdin.fileno()
+        with _key_mode(fd) as line_mode:
+            selected = 0
+            n = len(self.modules)
+            while True:
+                if self.apply_module_updates():
+                    n = len(self.modules)
+                    selected = max(min(selected, n - 1), 0)
+                print("\n" + "="*50)
+                print("SpectrumSnek")
+                print("="*50)
+                print("Available tools:")
+
+                for i, module in enumerate(self.modules):
+                    if module._prep_width is not None:
+                        module._prepare(None)
+                    print("  " + (module._name_sel if i == selected else module._name_unsel))
+
+                print("\n  ↑↓ navigate, Enter select, 'q' quit")
+                print("="*50)
+                for message in self._take_status():
+                    print(message)
+
+                try:
+                    key = _read_key()
+
+                    if key == 'q' or key == 'Q':
+                        break
+                    elif key == 'up':
+                        selected = (selected - 1) % n
+                    elif key == 'down':
+                        selected = (selected + 1) % n
+                    elif key in ['\r', '\n']:
+                        self._run_in_line_mode(fd, line_mode, self.modules[selected])
+                    elif key.isdigit():
+                        idx = int(key) - 1
+                        if 0 <= idx < n:
+                            self._run_in_line_mode(fd, line_mode, self.modules[idx])
+                        else:
+                            print("Invalid choice.")
                     else:
-                        print("Invalid choice.")
-                else:
-                    print("Invalid input.")
-                    
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except EOFError:
-                print("\nExiting...")
-                break
+                        print("Invalid input.")
+
+                except KeyboardInterrupt:
+                    print("\nExiting...")
+                    break
+                except EOFError:
+                    print("\nExiting...")
+                    break
+
+    def _run_in_line_mode(self, fd: int, line_mode, module: ModuleInfo):
+        """Run a module from the text menu with the terminal's normal modes."""
+        import termios
+        import tty
+        termios.tcsetattr(fd, termios.TCSADRAIN, line_mode)
+        try:
+            self.run_selected_module_text(module)
+        finally:
+            tty.setcbreak(fd)
 
     def run_curses_menu(self, stdscr):
         """Run the curses menu."""
@@ -637,19 +1168,15 @@ class RadioToolsLoader:
             except (EOFError, KeyboardInterrupt):
                 pass  # Allow graceful exit in remote sessions
 
+@lru_cache(maxsize=1)
+def _missing_dependencies():
+    """Names of the required packages that can't be found, probed once."""
+    # find_spec only consults the import finders; it doesn't load the packages
+    return tuple(dep for dep in ("numpy", "scipy") if importlib.util.find_spec(dep) is None)
+
 def check_dependencies():
     """Check if basic dependencies are available."""
-    missing_deps = []
-
-    try:
-        import numpy
-    except ImportError:
-        missing_deps.append("numpy")
-
-    try:
-        import scipy
-    except ImportError:
-        missing_deps.append("scipy")
+    missing_deps = _missing_dependencies()
 
     if missing_deps:
         print("Missing dependencies:")
@@ -660,13 +1187,71 @@ def check_dependencies():
 
     return True
 
+# Command-line module names -> (module path, entry point, display name);
+# "demo" runs the standalone demo scanner, which takes an argv list
+DISPATCH = {
+    "rtl_scanner": ("plugins.rtl_scanner", "run", "RTL-SDR Scanner"),
+    "scanner": ("plugins.rtl_scanner", "run", "RTL-SDR Scanner"),
+    "adsb": ("plugins.adsb_tool", "run", "ADS-B Aircraft Tracker"),
+    "adsb_tool": ("plugins.adsb_tool", "run", "ADS-B Aircraft Tracker"),
+    "demo": None,
+}
+
+def _parse_direct_args(argv):
+    """Return (module name, tool args) if argv launches a known module.
+
+    --service-url is accepted (and dropped) anywhere, as argparse would;
+    any other option before the module name leaves parsing to argparse.
+    """
+    rest = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--service-url':
+            i += 2
+            continue
+        if arg.startswith('--service-url='):
+            i += 1
+            continue
+        if not rest and arg.startswith('-'):
+            return None
+        rest.append(arg)
+        i += 1
+
+    if not rest or rest[0] not in DISPATCH:
+        return None
+    return rest[0], rest[1:]
+
+def run_direct_module(module_name, args):
+    """Run a tool directly from the command line, bypassing the menu."""
+    if module_name not in DISPATCH:
+        print(f"Unknown module: {module_name}")
+        print(f"Available modules: {', '.join(DISPATCH)}")
+        sys.exit(1)
+
+    entry = DISPATCH[module_name]
+    title = "Spectrum Demo" if entry is None else entry[2]
+    print(f"Starting {title} directly...")
+    try:
+        if entry is None:
+            cached_import("demo_scanner", "main")(args)
+        else:
+            cached_import(entry[0], entry[1])(*args)
+    except ImportError:
+        print(f"{title} not available. Run setup.sh first.")
+        sys.exit(1)
+
 def main():
     """Main entry point."""
     print("SpectrumSnek")
     print("=" * 20)
 
-    if not check_dependencies():
-        sys.exit(1)
+    # Direct tool launches need neither the dependency probe, the service
+    # nor argparse
+    direct = _parse_direct_args(sys.argv[1:])
+    if direct is not None:
+        run_direct_module(*direct)
+        return
 
     if len(sys.argv) > 1 and sys.argv[1] == "--service":
         # Run as service
@@ -697,6 +1282,11 @@ def main():
         service.run(host=host, port=port)
         return
 
+    # Only the menu needs the dependency probe; the service and direct
+    # launches are handled above
+    if not check_dependencies():
+        sys.exit(1)
+
     # For UI mode, parse arguments
     import argparse
 
@@ -704,8 +1294,17 @@ def main():
     parser.add_argument('--service-url', default='http://127.0.0.1:5000',
                        help='URL of the SpectrumSnek service (default: http://127.0.0.1:5000)')
 
+    parser.add_argument('--refresh-tools', action='store_true',
+                       help='Forget the cached tool list and ask the service afresh')
+
     args, unknown = parser.parse_known_args()
 
+    if args.refresh_tools:
+        try:
+            os.remove(TOOLS_CACHE_FILE)
+        except OSError:
+            pass
+
     loader = RadioToolsLoader(service_url=args.service_url)
 
     if len(sys.argv) > 1 and not sys.argv[1].startswith('-'):
@@ -714,27 +1313,7 @@ def main():
         # Remove module_name from unknown args
         if unknown and unknown[0] == module_name:
             unknown = unknown[1:]
-
-        if module_name == "rtl_scanner" or module_name == "scanner":
-            print("Starting RTL-SDR Scanner directly...")
-            try:
-                import plugins.rtl_scanner as rtl_scanner
-                rtl_scanner.run(*unknown)
-            except ImportError:
-                print("RTL-SDR scanner not available. Run setup.sh first.")
-                sys.exit(1)
-        elif module_name == "adsb" or module_name == "adsb_tool":
-            print("Starting ADS-B Aircraft Tracker directly...")
-            try:
-                import plugins.adsb_tool as adsb_tool
-                adsb_tool.run(*unknown)
-            except ImportError:
-                print("ADS-B tool not available. Run setup.sh first.")
-                sys.exit(1)
-        else:
-            print(f"Unknown module: {module_name}")
-            print("Available modules: rtl_scanner, adsb_tool, demo")
-            sys.exit(1)
+        run_direct_module(module_name, unknown)
     else:
         # Interactive menu - skip curses, use text menu directly
         try:
@@ -34,8 +34,46 @@ import json
 from typing import Dict, List, Optional
 from datetime import datetime
 import requests
+import socket
 import threading
 
+# Decoder port streaming SBS (BaseStation) messages as they are decoded
+SBS_PORT = 30003
+
+# Seconds an aircraft stays listed after its last message
+AIRCRAFT_RETENTION = 300
+
+# Seconds between sweeps for aircraft past AIRCRAFT_RETENTION
+PRUNE_INTERVAL = 10
+
+def _find_processes(names) -> List[int]:
+    """PIDs of other processes whose program name starts with any of names."""
+    own_pid = os.getpid()
+    pids = []
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own_pid:
+                continue
+            try:
+                with open(os.path.join(entry.path, 'cmdline'), 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # Exited meanwhile, or not ours to read
+            program = os.path.basename(cmdline.split(b'\0', 1)[0])
+            if program.startswith(names):
+                pids.append(int(entry.name))
+    return pids
+
+def _pid_alive(pid: int) -> bool:
+    """True while a process exists and isn't a zombie awaiting its parent."""
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return False
+    # State follows the parenthesized command name
+    return stat[stat.rfind(b')') + 2:stat.rfind(b')') + 3] != b'Z'
+
 class ADSBService:
     """ADS-B service using external decoder for aircraft detection."""
 
@@ -53,6 +91,13 @@ class ADSBService:
         self.last_update = time.time()
         self.start_time = time.time()
         self.decoder_cmd = None
+        # SBS stream socket, shut down by stop_service() to wake the reader
+        self._sbs_socket = None
+        # Bumped whenever aircraft_data changes; get_status() reuses its
+        # aircraft list until then
+        self._version = 0
+        self._aircraft_list = []
+        self._aircraft_list_version = -1
 
         # Memory optimization for low-RAM systems
         import gc
@@ -79,12 +124,26 @@ class ADSBService:
     def _stop_existing_readsb(self):
         """Stop any existing ADS-B decoder processes."""
         try:
-            # Kill any existing ADS-B decoder processes
-            decoders = ['readsb', 'dump1090-mutability', 'dump1090-fa', 'dump1090']
-            for cmd in decoders:
-                subprocess.run(['pkill', '-f', cmd],
-                              capture_output=True)
-            time.sleep(1)  # Wait for cleanup
+            # Signal decoders found in /proc directly, and only wait if
+            # there was something to stop
+            pids = _find_processes((b'readsb', b'dump1090'))
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass
+
+            for _ in range(20):
+                pids = [pid for pid in pids if _pid_alive(pid)]
+                if not pids:
+                    break
+                time.sleep(0.05)
+
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except OSError:
+                    pass
         except Exception:
             pass
 
@@ -229,7 +288,7 @@ class ADSBService:
             elif dump1090_cmd == 'dump1090-fa':
                 cmd.extend(['--device-type', 'rtlsdr', '--net', '--net-ro-port', '8080'])
             elif dump1090_cmd == 'dump1090-mutability':
-                cmd.extend(['--net', '--net-sbs-port', '30003'])
+                cmd.extend(['--net', '--net-sbs-port', str(SBS_PORT)])
             else:
                 cmd.extend(['--device-index', '0', '--net'])
 
@@ -241,7 +300,7 @@ class ADSBService:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=os.setsid
+                start_new_session=True
             )
 
             # Wait for startup
@@ -374,6 +433,65 @@ class ADSBService:
 
         return aircraft_data
 
+    def _collect_aircraft_data(self):
+        """Merge aircraft updates from the decoder's SBS stream as they arrive.
+
+        The decoder pushes one line per message, so the thread sleeps in
+        recv() until there is news instead of polling on a timer. recv()
+        gives up after PRUNE_INTERVAL, so stale aircraft are still dropped
+        when the sky goes quiet.
+        """
+        last_prune = time.time()
+        while self.running:
+            try:
+                sock = socket.create_connection(('127.0.0.1', SBS_PORT), timeout=5)
+            except OSError:
+                time.sleep(1)  # Decoder not listening yet
+                continue
+
+            self._sbs_socket = sock
+            sock.settimeout(PRUNE_INTERVAL)
+            pending = b''
+            try:
+                while self.running:
+                    try:
+                        chunk = sock.recv(65536)
+                    except socket.timeout:
+                        pass  # No traffic; just prune
+                    else:
+                        if not chunk:
+                            break
+                        pending += chunk
+                    complete, sep, pending = pending.rpartition(b'\n')
+
+                    if sep:
+                        # Replace each updated entry with a merged copy
+                        # rather than changing it, so get_status() readers
+                        # serializing an entry on another thread never see
+                        # it change size
+                        updates = self._parse_sbs_data(complete.decode('ascii', 'replace'))
+                        for icao, info in updates.items():
+                            self.aircraft_data[icao] = {**self.aircraft_data.get(icao, {}), **info}
+                        if updates:
+                            self._version += 1
+                            self.last_update = time.time()
+
+                    now = time.time()
+                    if now - last_prune >= PRUNE_INTERVAL:
+                        cutoff = datetime.now().timestamp() - AIRCRAFT_RETENTION
+                        stale = [icao for icao, info in self.aircraft_data.items()
+                                 if info['last_update'].timestamp() < cutoff]
+                        for icao in stale:
+                            del self.aircraft_data[icao]
+                        if stale:
+                            self._version += 1
+                        last_prune = now
+            except OSError:
+                pass
+            finally:
+                self._sbs_socket = None
+                sock.close()
+
     def stop_service(self):
         """
         Stop the ADS-B service and clean up resources.
@@ -389,6 +507,14 @@ class ADSBService:
         print("Stopping ADS-B service...", flush=True)
         self.running = False
 
+        # Wake the collector thread out of recv()
+        sock = self._sbs_socket
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
         # Stop ADS-B decoder process if running
         if hasattr(self, 'readsb_process') and self.readsb_process and self.readsb_process.poll() is None:
             try:
@@ -406,10 +532,14 @@ class ADSBService:
 
     def get_status(self) -> Dict:
         """Get service status and aircraft data."""
+        version = self._version
+        if version != self._aircraft_list_version:
+            self._aircraft_list = list(self.aircraft_data.values())
+            self._aircraft_list_version = version
         return {
             'running': self.running,
-            'aircraft_count': len(self.aircraft_data),
-            'aircraft': list(self.aircraft_data.values()),  # Include actual aircraft data
+            'aircraft_count': len(self._aircraft_list),
+            'aircraft': self._aircraft_list,  # Include actual aircraft data
             'uptime': time.time() - self.start_time if hasattr(self, 'start_time') else 0,
             'last_update': self.last_update
         }
@@ -458,17 +588,20 @@ def run_text_interface(service: ADSBService):
     last_display = 0
     try:
         while service.running:
-            current_time = time.time()
-            status = service.get_status()
-
-            # Check for 'q' key press
-            if select.select([sys.stdin], [], [], 0)[0]:
+            # Sleep until a key arrives or the next redraw is due
+            timeout = max(0, 2 - (time.monotonic() - last_display))
+            if select.select([sys.stdin], [], [], timeout)[0]:
                 key = sys.stdin.read(1)
-                if key.lower() == 'q':
+                # An empty read means the terminal hung up; stdin would stay
+                # readable and the loop would spin
+                if not key or key.lower() == 'q':
                     break
 
+            current_time = time.monotonic()
+
             # Update display every 2 seconds
             if current_time - last_display >= 2:
+                status = service.get_status()
                 # Clear screen and show aircraft data
                 print("\033[2J\033[H", end="")  # Clear screen and move to top
                 print("ADS-B Aircraft Tracker - Real-time Surveillance")
@@ -501,13 +634,14 @@ def run_text_interface(service: ADSBService):
                 print("Press Ctrl+C or 'q' to quit")
                 last_display = current_time
 
-            time.sleep(0.1)
-
     except KeyboardInterrupt:
         pass
     finally:
-        # Restore terminal settings
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        # Restore terminal settings, unless the terminal is already gone
+        try:
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        except termios.error:
+            pass
         print("\nStopping ADS-B interface...")
         service.stop_service()
 
@@ -7,7 +7,6 @@ Submenu for system utilities including connectivity and updates.
 
 import curses
 import subprocess
-import time
 import os
 from typing import List, Dict, Any, Optional
 
@@ -262,6 +261,7 @@ class SystemMenu:
             def run_menu(self, stdscr):
                 """Run the screen selection menu."""
                 curses.curs_set(0)
+                stdscr.timeout(-1)  # Sleep in getch() until a key arrives
 
                 while True:
                     self.draw_menu(stdscr)
@@ -282,8 +282,6 @@ class SystemMenu:
                             else:
                                 return selected_screen  # Return selected config
 
-                        time.sleep(0.05)
-
                     except KeyboardInterrupt:
                         return None
 
@@ -1115,6 +1113,7 @@ echo "Display setup complete!"
     def run_menu(self, stdscr):
         """Run the system tools menu."""
         curses.curs_set(0)
+        stdscr.timeout(-1)  # Sleep in getch() until a key arrives
 
         while True:
             self.draw_menu(stdscr)
@@ -1140,8 +1139,6 @@ echo "Display setup complete!"
                 elif key == 27:  # ESC
                     return True  # Back
 
-                time.sleep(0.05)
-
             except KeyboardInterrupt:
                 return False
 
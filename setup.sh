@@ -108,6 +108,14 @@ else
     echo "⚠ requirements.txt not found"
 fi
 
+# Pre-compile bytecode so the first launch doesn't have to
+echo "Pre-compiling Python bytecode..."
+if python -m compileall -q -j0 -x '/venv/' "$SCRIPT_DIR"; then
+    echo "✓ Python bytecode compiled"
+else
+    echo "⚠ Some Python files failed to compile"
+fi
+
 # Install ADS-B decoder
 echo "Checking for ADS-B decoder..."
 
@@ -8,7 +8,9 @@ import sys
 import os
 
 # Add the current directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 def run_scanner():
     """Run the RTL-SDR scanner module."""
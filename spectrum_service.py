@@ -17,8 +17,10 @@ import psutil
 # Import configuration manager
 from config_manager import config_manager
 
-# Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add current directory to path, unless it is already there
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 class SpectrumService:
     """Core service for managing radio tools."""
@@ -147,7 +149,7 @@ class SpectrumService:
         @self.app.route('/api/tools', methods=['GET'])
         def get_tools():
             """Get list of available tools."""
-            return jsonify({
+            response = jsonify({
                 'tools': {
                     name: {
                         'info': tool['info'],
@@ -155,6 +157,9 @@ class SpectrumService:
                     } for name, tool in self.tools.items()
                 }
             })
+            # Clients sending the ETag they cached get 304 Not Modified
+            response.add_etag()
+            return response.make_conditional(request)
 
         @self.app.route('/api/tools/<tool_name>/start', methods=['POST'])
         def start_tool(tool_name):
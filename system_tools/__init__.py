@@ -6,6 +6,9 @@ Basic spectrum analysis demonstration without hardware.
 
 from typing import Dict, Any
 
+# Demo scanner arguments used when launched from the menu
+_DEMO_ARGV = ('--freq', '100', '--mode', 'spectrum', '--duration', '10')
+
 # Module metadata
 MODULE_INFO = {
     "name": "Spectrum Analyzer (Demo)",
@@ -33,8 +36,7 @@ def run():
 
         import demo_scanner
         # Run with default parameters
-        sys.argv = ['demo_scanner', '--freq', '100', '--mode', 'spectrum', '--duration', '10']
-        demo_scanner.main()
+        demo_scanner.main(_DEMO_ARGV)
     except ImportError as e:
         print(f"Error importing demo scanner: {e}")
         print("Make sure demo_scanner.py is available.")
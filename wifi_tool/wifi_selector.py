@@ -42,10 +42,8 @@ class WiFiSelector:
             networks = []
             seen_ssids = set()
 
-            for line in result.stdout.strip().split('\n'):
-                if not line.strip():
-                    continue
-
+            # Skip blank lines without copying or re-stripping the output
+            for line in filter(str.strip, result.stdout.splitlines()):
                 parts = line.split(':')
                 if len(parts) >= 3:
                     ssid = parts[0]
@@ -180,6 +178,7 @@ class WiFiSelector:
         curses.curs_set(0)
         curses.start_color()
         curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
+        stdscr.timeout(-1)  # Sleep in getch() until a key arrives
 
         # Initial scan
         self.networks = self.scan_networks()
@@ -221,8 +220,6 @@ class WiFiSelector:
                 elif key == 27:  # ESC
                     return
 
-                time.sleep(0.05)
-
             except KeyboardInterrupt:
                 return
 